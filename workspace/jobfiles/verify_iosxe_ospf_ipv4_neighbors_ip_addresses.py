@@ -3,22 +3,22 @@
 import logging
 
 from pyats import aetest
-from utils.connectivity import (
-    connect_to_testbed_devices,
-    disconnect_from_testbed_devices,
-    run_command_on_devices,
-    verify_testbed_device_connectivity,
-)
+from utils.aetest_bases import StandardCommonCleanup, StandardCommonSetup
+from utils.comparison import MISSING, flatten_neighbor_state
+from utils.connectivity import run_command_on_devices
 from utils.context import Context
-from utils.parameters import (
-    validate_parameters_directory_exists,
-)
-from utils.reports import generate_job_report
 from utils.runner import handle_test_execution_mode
-from utils.types import ResultStatus, RunningMode
+from utils.templates import compile_string_template
+from utils.types import ResultStatus
 
 logger = logging.getLogger(__name__)
 
+OSPF_NEIGHBOR_COMMAND = "show ip ospf neighbor"
+
+# Commands run on every device during common setup. Their parsed output is
+# cached on the context, so gather_current_state does not re-issue them.
+PREFETCH_COMMANDS = [OSPF_NEIGHBOR_COMMAND]
+
 DESCRIPTION = (
     "The purpose of this test case is to validate the IP addresses of "
     "IPv4 OSPF neighbors on one or more IOS-XE devices. "
@@ -58,6 +58,10 @@ PROCEDURE = (
     "{% endfor %}"
 )
 
+# PROCEDURE is rendered against the parameters file for every report, so
+# compile it once when the jobfile is loaded.
+PROCEDURE_TEMPLATE = compile_string_template(PROCEDURE)
+
 PASS_FAIL_CRITERIA = (
     "**This test passes when all of the following conditions are met:**\n"
     "\n"
@@ -78,23 +82,10 @@ PASS_FAIL_CRITERIA = (
 )
 
 
-class CommonSetup(aetest.CommonSetup):
+class CommonSetup(StandardCommonSetup):
     """Setup for script."""
 
-    @aetest.subsection
-    def connect_to_devices(self, context: Context):
-        """Connect to all devices in the testbed."""
-        connect_to_testbed_devices(context.testbed_adapter)
-
-    @aetest.subsection
-    def verify_connected(self, context: Context):
-        """Verify that all devices are connected."""
-        verify_testbed_device_connectivity(context.testbed_adapter, self.failed)
-
-    @aetest.subsection
-    def ensure_parameters_directory_exists(self):
-        """Create parameters directory if it doesn't exist."""
-        validate_parameters_directory_exists(self.failed)
+    prefetch_commands = PREFETCH_COMMANDS
 
 
 class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
@@ -108,7 +99,7 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
         Set test mode: learning or testing
         """
         self.mode = context.mode
-        logger.info(f"Running in {self.mode} mode")
+        logger.info("Running in %s mode", self.mode)
 
     def gather_current_state(self, context: Context) -> dict:
         """Gather the current state of each device."""
@@ -116,7 +107,7 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
 
         # Collect OSPF data from all devices using 'show ip ospf neighbor'
         parsed_data = run_command_on_devices(
-            command="show ip ospf neighbor",
+            command=OSPF_NEIGHBOR_COMMAND,
             testbed=context.testbed_adapter,
             context=context,
         )
@@ -142,8 +133,8 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
             data = execution_result.data
 
             # Check if there are any OSPF interfaces and neighbors
-            if "interfaces" not in data or not data["interfaces"]:
-                logger.warning(f"No OSPF interfaces found on {device.name}")
+            if not (interfaces := data.get("interfaces")):
+                logger.warning("No OSPF interfaces found on %s", device.name)
                 all_devices_data[device.name] = {}
                 context.test_result_collector.add_result(
                     status=ResultStatus.INFO,
@@ -159,41 +150,56 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
 
             # Process OSPF neighbors
             device_ospf_data = {}
-            for interface_name, interface_data in data["interfaces"].items():
-                if "neighbors" not in interface_data or not interface_data["neighbors"]:
+            # Buffer results and hand them to the collector once per device
+            pending_results: list[tuple[ResultStatus, str]] = []
+            add_pending_result = pending_results.append
+            for interface_name, interface_data in interfaces.items():
+                if not (neighbors := interface_data.get("neighbors")):
                     continue
 
-                if interface_name not in device_ospf_data:
-                    device_ospf_data[interface_name] = {"neighbors": {}}
-
                 # Process each neighbor
-                for neighbor_id, neighbor_data in interface_data["neighbors"].items():
-                    device_ospf_data[interface_name]["neighbors"][neighbor_id] = {
-                        "address": neighbor_data.get("address", ""),
-                    }
-                    context.test_result_collector.add_result(
-                        status=ResultStatus.INFO,
-                        message=(
-                            f"On device {device.name}, the output of the "
-                            "*show ip ospf neighbor* command indicates that "
-                            f"interface {interface_name} has an OSPF neighbor "
-                            f"with router ID {neighbor_id} at IP address "
-                            f"{neighbor_data.get('address', '')}. This "
-                            "information will be used for verification or "
-                            "learning purposes."
-                        ),
+                interface_neighbors = {}
+                device_ospf_data[interface_name] = {"neighbors": interface_neighbors}
+                # Shared opening of the per-neighbor messages below
+                interface_prefix = (
+                    f"On device {device.name}, the output of the *show ip ospf "
+                    f"neighbor* command indicates that interface {interface_name}"
+                )
+                for neighbor_id, neighbor_data in neighbors.items():
+                    try:
+                        neighbor_address = neighbor_data["address"]
+                    except KeyError:
+                        msg = (
+                            f"{interface_prefix} has an OSPF neighbor with router ID "
+                            f"{neighbor_id}, but the IP address of this neighbor could not "
+                            f"be determined from the command output. This could indicate "
+                            f"unexpected output from the device. This behavior is "
+                            f"unexpected, so this test case must fail."
+                        )
+                        add_pending_result((ResultStatus.FAILED, msg))
+                        context.test_result_collector.add_results(pending_results)
+                        pending_results.clear()
+                        self.failed(msg)
+                        continue
+                    interface_neighbors[neighbor_id] = {"address": neighbor_address}
+                    message = (
+                        f"{interface_prefix} has an OSPF neighbor "
+                        f"with router ID {neighbor_id} at IP address "
+                        f"{neighbor_address}. This "
+                        "information will be used for verification or "
+                        "learning purposes."
                     )
+                    add_pending_result((ResultStatus.INFO, message))
 
             all_devices_data[device.name] = device_ospf_data
-            context.test_result_collector.add_result(
-                status=ResultStatus.PASSED,
-                message=(
-                    "The test successfully gathered OSPF neighbor data from "
-                    f"device {device.name} using the *show ip ospf neighbor* "
-                    "command. All data was retrieved and parsed correctly. "
-                    "This behavior is as expected for this test phase."
-                ),
+            message = (
+                "The test successfully gathered OSPF neighbor data from "
+                f"device {device.name} using the *show ip ospf neighbor* "
+                "command. All data was retrieved and parsed correctly. "
+                "This behavior is as expected for this test phase."
             )
+            add_pending_result((ResultStatus.PASSED, message))
+            context.test_result_collector.add_results(pending_results)
 
         return all_devices_data
 
@@ -204,9 +210,16 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
         context: Context,
     ) -> None:
         """Compare the current state of each device to the expected parameters for each device."""
-        logger.info("Validating current state of devices against expected parameters")
+        # Bind the logging call locally, as it is made several times per neighbor,
+        # and check the level once so per-neighbor messages can be skipped entirely
+        log_info = logger.info
+        log_info_enabled = logger.isEnabledFor(logging.INFO)
+        log_info("Validating current state of devices against expected parameters")
+        # Index current neighbor values by (device, interface, neighbor ID) so each
+        # comparison below is a single lookup rather than a nested traversal
+        current_values = flatten_neighbor_state(current_state, "address")
         for expected_device_name, expected_device_data in expected_parameters.items():
-            logger.info("Checking current state of device %s", expected_device_name)
+            log_info("Checking current state of device %s", expected_device_name)
             if expected_device_name not in current_state:
                 msg = (
                     f"The test expected to find device {expected_device_name} "
@@ -222,26 +235,43 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
                 self.failed(msg)
                 continue
 
-            logger.info(
-                f"Found expected device {expected_device_name} in current state"
-            )
-            context.test_result_collector.add_result(
-                status=ResultStatus.PASSED,
-                message=(
-                    "The test successfully verified that device "
-                    f"{expected_device_name} exists in the current network "
-                    "state and is accessible. This behavior is as expected."
-                ),
+            log_info("Found expected device %s in current state", expected_device_name)
+            # Buffer results and hand them to the collector once per device
+            pending_results: list[tuple[ResultStatus, str]] = []
+            add_pending_result = pending_results.append
+            message = (
+                "The test successfully verified that device "
+                f"{expected_device_name} exists in the current network "
+                "state and is accessible. This behavior is as expected."
             )
+            add_pending_result((ResultStatus.PASSED, message))
+
+            # A device with no OSPF neighbors at all fails every expected interface,
+            # so report that once rather than walking the expected parameters
+            current_device_data = current_state[expected_device_name]
+            if not current_device_data and expected_device_data:
+                msg = (
+                    f"The test expected device {expected_device_name} to have OSPF "
+                    f"neighbors on {len(expected_device_data)} interface(s), but the "
+                    f"device currently has no OSPF interfaces with active neighbors. "
+                    f"This could indicate that the OSPF process is down or has been "
+                    f"removed, or that all neighbor relationships have been lost. This "
+                    f"behavior is unexpected, so this test case must fail."
+                )
+                add_pending_result((ResultStatus.FAILED, msg))
+                context.test_result_collector.add_results(pending_results)
+                pending_results.clear()
+                self.failed(msg)
+                continue
 
             # Compare each interface and neighbor
             for interface_name, interface_data in expected_device_data.items():
-                logger.info(
+                log_info(
                     "Checking current state of interface %s on device %s",
                     interface_name,
                     expected_device_name,
                 )
-                if interface_name not in current_state[expected_device_name]:
+                if interface_name not in current_device_data:
                     msg = (
                         f"The test expected to find interface {interface_name} "
                         f"on device {expected_device_name}, but this interface "
@@ -251,31 +281,34 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
                         "process issue on this interface. This behavior is "
                         "unexpected, so this test case must fail."
                     )
-                    context.test_result_collector.add_result(
-                        status=ResultStatus.FAILED, message=msg
-                    )
+                    add_pending_result((ResultStatus.FAILED, msg))
+                    context.test_result_collector.add_results(pending_results)
+                    pending_results.clear()
                     self.failed(msg)
                     continue
 
-                logger.info(
-                    f"Found expected interface {interface_name} in current state for device "
-                    f"{expected_device_name}"
+                log_info(
+                    "Found expected interface %s in current state for device %s",
+                    interface_name,
+                    expected_device_name,
                 )
-                context.test_result_collector.add_result(
-                    status=ResultStatus.PASSED,
-                    message=(
-                        f"On device {expected_device_name}, the test verified that "
-                        f"interface {interface_name} exists and has active OSPF neighbors. "
-                        "This behavior is as expected."
-                    ),
+                message = (
+                    f"On device {expected_device_name}, the test verified that "
+                    f"interface {interface_name} exists and has active OSPF neighbors. "
+                    "This behavior is as expected."
                 )
+                add_pending_result((ResultStatus.PASSED, message))
 
                 expected_neighbors = interface_data.get("neighbors", {})
-                actual_neighbors = current_state[expected_device_name][
-                    interface_name
-                ].get("neighbors", {})
+                actual_neighbors = current_device_data[interface_name].get(
+                    "neighbors", {}
+                )
+                # Shared opening of the per-interface and per-neighbor messages below
+                interface_prefix = (
+                    f"On device {expected_device_name}, interface {interface_name}"
+                )
 
-                logger.info(
+                log_info(
                     "Comparing %d expected neighbors against %d current neighbors for interface "
                     "%s on device %s",
                     len(expected_neighbors),
@@ -283,63 +316,74 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
                     interface_name,
                     expected_device_name,
                 )
-                context.test_result_collector.add_result(
-                    status=ResultStatus.INFO,
-                    message=(
-                        f"On device {expected_device_name}, interface "
-                        f"{interface_name} currently has "
-                        f"{len(actual_neighbors)} OSPF neighbors, while the "
-                        "expected number of neighbors is "
-                        f"{len(expected_neighbors)}. This information will be "
-                        "used for detailed comparison."
-                    ),
+                message = (
+                    f"{interface_prefix} currently has "
+                    f"{len(actual_neighbors)} OSPF neighbors, while the "
+                    "expected number of neighbors is "
+                    f"{len(expected_neighbors)}. This information will be "
+                    "used for detailed comparison."
                 )
+                add_pending_result((ResultStatus.INFO, message))
 
-                # Compare each expected neighbor
+                # Report every missing neighbor at once, then compare the rest
+                missing_neighbor_ids = (
+                    expected_neighbors.keys() - actual_neighbors.keys()
+                )
+                for neighbor_id in sorted(missing_neighbor_ids):
+                    msg = (
+                        f"{interface_prefix} is missing an expected OSPF "
+                        f"neighbor with router ID {neighbor_id}. This "
+                        "could indicate a connectivity issue, OSPF "
+                        "configuration change, or that the neighbor "
+                        "router is down. This behavior is unexpected, so "
+                        "this test case must fail."
+                    )
+                    add_pending_result((ResultStatus.FAILED, msg))
+                if missing_neighbor_ids:
+                    context.test_result_collector.add_results(pending_results)
+                    pending_results.clear()
+                    self.failed(
+                        f"{interface_prefix} "
+                        f"is missing {len(missing_neighbor_ids)} expected OSPF "
+                        "neighbor(s)."
+                    )
+
+                # Compare each expected neighbor that is present
                 for neighbor_id, expected_neighbor_data in expected_neighbors.items():
-                    logger.info(
-                        "Checking current state of neighbor %s on interface %s of device %s",
-                        neighbor_id,
-                        interface_name,
-                        expected_device_name,
+                    current_neighbor_address = current_values.get(
+                        (expected_device_name, interface_name, neighbor_id), MISSING
                     )
-                    if neighbor_id not in actual_neighbors:
-                        msg = (
-                            f"On device {expected_device_name}, interface "
-                            f"{interface_name} is missing an expected OSPF "
-                            f"neighbor with router ID {neighbor_id}. This "
-                            "could indicate a connectivity issue, OSPF "
-                            "configuration change, or that the neighbor "
-                            "router is down. This behavior is unexpected, so "
-                            "this test case must fail."
-                        )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.FAILED, message=msg
-                        )
-                        self.failed(msg)
+                    if current_neighbor_address is MISSING:
                         continue
 
-                    logger.info(
-                        f"Found expected neighbor {neighbor_id} on interface {interface_name} "
-                        f"for device {expected_device_name}"
-                    )
-                    current_neighbor_data = actual_neighbors[neighbor_id]
-                    current_neighbor_address = current_neighbor_data.get("address")
+                    if log_info_enabled:
+                        log_info(
+                            "Checking current state of neighbor %s on interface %s of device %s",
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                        )
+                        log_info(
+                            "Found expected neighbor %s on interface %s for device %s",
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                        )
                     expected_neighbor_address = expected_neighbor_data.get("address")
 
-                    logger.info(
-                        "Comparing current IP address '%s' of neighbor %s on interface %s of device %s "
-                        "against expected IP address '%s'",
-                        current_neighbor_address,
-                        neighbor_id,
-                        interface_name,
-                        expected_device_name,
-                        expected_neighbor_address,
-                    )
+                    if log_info_enabled:
+                        log_info(
+                            "Comparing current IP address '%s' of neighbor %s on interface %s of device %s "
+                            "against expected IP address '%s'",
+                            current_neighbor_address,
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                            expected_neighbor_address,
+                        )
                     if current_neighbor_address != expected_neighbor_address:
                         msg = (
-                            f"On device {expected_device_name}, interface "
-                            f"{interface_name}, the OSPF neighbor with router "
+                            f"{interface_prefix}, the OSPF neighbor with router "
                             f"ID {neighbor_id} has an IP address of "
                             f"{current_neighbor_address}, which does not match "
                             "the expected IP address of "
@@ -348,28 +392,31 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
                             "or potential security issue. This behavior is "
                             "unexpected, so this test case must fail."
                         )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.FAILED, message=msg
-                        )
+                        add_pending_result((ResultStatus.FAILED, msg))
+                        context.test_result_collector.add_results(pending_results)
+                        pending_results.clear()
                         self.failed(msg)
                     else:
-                        logger.info(
-                            f"The current IP address of neighbor {neighbor_id} on interface "
-                            f"{interface_name} is {current_neighbor_address}, which matches the "
-                            f"expected IP address of this neighbor which is {expected_neighbor_address}"
-                        )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.PASSED,
-                            message=(
-                                f"On device {expected_device_name}, "
-                                f"interface {interface_name}, the OSPF "
-                                f"neighbor with router ID {neighbor_id} has "
-                                "the expected IP address of "
-                                f"{current_neighbor_address}. This confirms "
-                                "the network topology and addressing are "
-                                "correct. This behavior is as expected."
-                            ),
+                        if log_info_enabled:
+                            log_info(
+                                "The current IP address of neighbor %s on interface %s is %s, "
+                                "which matches the expected IP address of this neighbor which is %s",
+                                neighbor_id,
+                                interface_name,
+                                current_neighbor_address,
+                                expected_neighbor_address,
+                            )
+                        message = (
+                            f"{interface_prefix}, the OSPF "
+                            f"neighbor with router ID {neighbor_id} has "
+                            "the expected IP address of "
+                            f"{current_neighbor_address}. This confirms "
+                            "the network topology and addressing are "
+                            "correct. This behavior is as expected."
                         )
+                        add_pending_result((ResultStatus.PASSED, message))
+
+            context.test_result_collector.add_results(pending_results)
 
     @aetest.test
     def verify_ospf_neighbors_ip_addresses(self, context: Context):
@@ -386,27 +433,14 @@ class VerifyOSPFNeighborsIPAddresses(aetest.Testcase):
         )
 
 
-class CommonCleanup(aetest.CommonCleanup):
+class CommonCleanup(StandardCommonCleanup):
     """Cleanup for script."""
 
-    @aetest.subsection
-    def add_results_to_report(self, context: Context):
-        """Add accumulated results to the HTML report."""
-        if context.mode == RunningMode.TESTING:
-            generate_job_report(
-                task_id="ospf_neighbors_ip_addresses_detailed",
-                title="OSPF IPv4 Neighbors IP Addresses",
-                description=DESCRIPTION,
-                setup=SETUP,
-                procedure=PROCEDURE,
-                pass_fail_criteria=PASS_FAIL_CRITERIA,
-                results=context.test_result_collector.results,
-                command_executions=context.test_result_collector.command_executions,
-                status=context.test_result_collector.status,
-                parameters=context.testbed_adapter.parameters,
-            )
-
-    @aetest.subsection
-    def disconnect_from_devices(self, context: Context):
-        """Disconnect from all devices in the testbed."""
-        disconnect_from_testbed_devices(context.testbed_adapter)
+    report_config = {
+        "task_id": "ospf_neighbors_ip_addresses_detailed",
+        "title": "OSPF IPv4 Neighbors IP Addresses",
+        "description": DESCRIPTION,
+        "setup": SETUP,
+        "procedure": PROCEDURE_TEMPLATE,
+        "pass_fail_criteria": PASS_FAIL_CRITERIA,
+    }
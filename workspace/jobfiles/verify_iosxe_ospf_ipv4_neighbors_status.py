@@ -3,22 +3,22 @@
 import logging
 
 from pyats import aetest
-from utils.connectivity import (
-    connect_to_testbed_devices,
-    disconnect_from_testbed_devices,
-    run_command_on_devices,
-    verify_testbed_device_connectivity,
-)
+from utils.aetest_bases import StandardCommonCleanup, StandardCommonSetup
+from utils.comparison import MISSING, flatten_neighbor_state
+from utils.connectivity import run_command_on_devices
 from utils.context import Context
-from utils.parameters import (
-    validate_parameters_directory_exists,
-)
-from utils.reports import generate_job_report
 from utils.runner import handle_test_execution_mode
-from utils.types import ResultStatus, RunningMode
+from utils.templates import compile_string_template
+from utils.types import ResultStatus
 
 logger = logging.getLogger(__name__)
 
+OSPF_NEIGHBOR_COMMAND = "show ip ospf neighbor"
+
+# Commands run on every device during common setup. Their parsed output is
+# cached on the context, so gather_current_state does not re-issue them.
+PREFETCH_COMMANDS = [OSPF_NEIGHBOR_COMMAND]
+
 
 DESCRIPTION = (
     "The purpose of this test case is to validate the adjacency status of "
@@ -60,6 +60,10 @@ PROCEDURE = (
     "{% endfor %}"
 )
 
+# PROCEDURE is rendered against the parameters file for every report, so
+# compile it once when the jobfile is loaded.
+PROCEDURE_TEMPLATE = compile_string_template(PROCEDURE)
+
 PASS_FAIL_CRITERIA = (
     "**This test passes when all of the following conditions are met:**\n"
     "\n"
@@ -80,23 +84,10 @@ PASS_FAIL_CRITERIA = (
 )
 
 
-class CommonSetup(aetest.CommonSetup):
+class CommonSetup(StandardCommonSetup):
     """Setup for script."""
 
-    @aetest.subsection
-    def connect_to_devices(self, context: Context):
-        """Connect to all devices in the testbed."""
-        connect_to_testbed_devices(context.testbed_adapter)
-
-    @aetest.subsection
-    def verify_connected(self, context: Context):
-        """Verify that all devices are connected."""
-        verify_testbed_device_connectivity(context.testbed_adapter, self.failed)
-
-    @aetest.subsection
-    def ensure_parameters_directory_exists(self):
-        """Create parameters directory if it doesn't exist."""
-        validate_parameters_directory_exists(self.failed)
+    prefetch_commands = PREFETCH_COMMANDS
 
 
 class VerifyOSPFNeighborsStatus(aetest.Testcase):
@@ -110,7 +101,7 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
         Set test mode: learning or testing
         """
         self.mode = context.mode
-        logger.info(f"Running in {self.mode} mode")
+        logger.info("Running in %s mode", self.mode)
 
     def gather_current_state(self, context: Context) -> dict:
         """Gather the current state of each device."""
@@ -118,7 +109,7 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
 
         # Collect OSPF data from all devices
         parsed_data = run_command_on_devices(
-            command="show ip ospf neighbor",
+            command=OSPF_NEIGHBOR_COMMAND,
             testbed=context.testbed_adapter,
             context=context,
         )
@@ -144,7 +135,7 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
             data = execution_result.data
 
             # Check if there are any OSPF interfaces and neighbors
-            if "interfaces" not in data or not data["interfaces"]:
+            if not (interfaces := data.get("interfaces")):
                 all_devices_data[device.name] = {}
                 context.test_result_collector.add_result(
                     status=ResultStatus.INFO,
@@ -160,39 +151,55 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
 
             # Process OSPF neighbors
             device_ospf_data = {}
-            for interface_name, interface_data in data["interfaces"].items():
-                if "neighbors" not in interface_data or not interface_data["neighbors"]:
+            # Buffer results and hand them to the collector once per device
+            pending_results: list[tuple[ResultStatus, str]] = []
+            add_pending_result = pending_results.append
+            for interface_name, interface_data in interfaces.items():
+                if not (neighbors := interface_data.get("neighbors")):
                     continue
 
-                if interface_name not in device_ospf_data:
-                    device_ospf_data[interface_name] = {"neighbors": {}}
-
                 # Process each neighbor
-                for neighbor_id, neighbor_data in interface_data["neighbors"].items():
-                    device_ospf_data[interface_name]["neighbors"][neighbor_id] = {
-                        "state": neighbor_data.get("state", ""),
-                    }
-                    context.test_result_collector.add_result(
-                        status=ResultStatus.INFO,
-                        message=(
-                            f"On device {device.name}, the output of the *show ip ospf "
-                            f"neighbor* command indicates that interface {interface_name} "
-                            f"has an OSPF neighbor with router ID {neighbor_id} in state "
-                            f"*{neighbor_data.get('state', '')}*. The neighbor state "
-                            f"indicates the level of adjacency formation between the routers."
-                        ),
+                interface_neighbors = {}
+                device_ospf_data[interface_name] = {"neighbors": interface_neighbors}
+                # Shared opening of the per-neighbor messages below
+                interface_prefix = (
+                    f"On device {device.name}, the output of the *show ip ospf "
+                    f"neighbor* command indicates that interface {interface_name}"
+                )
+                for neighbor_id, neighbor_data in neighbors.items():
+                    try:
+                        neighbor_state = neighbor_data["state"]
+                    except KeyError:
+                        msg = (
+                            f"{interface_prefix} has an OSPF neighbor with router ID "
+                            f"{neighbor_id}, but the state of this neighbor could not "
+                            f"be determined from the command output. This could indicate "
+                            f"unexpected output from the device. This behavior is "
+                            f"unexpected, so this test case must fail."
+                        )
+                        add_pending_result((ResultStatus.FAILED, msg))
+                        context.test_result_collector.add_results(pending_results)
+                        pending_results.clear()
+                        self.failed(msg)
+                        continue
+                    interface_neighbors[neighbor_id] = {"state": neighbor_state}
+                    message = (
+                        f"{interface_prefix} "
+                        f"has an OSPF neighbor with router ID {neighbor_id} in state "
+                        f"*{neighbor_state}*. The neighbor state "
+                        f"indicates the level of adjacency formation between the routers."
                     )
+                    add_pending_result((ResultStatus.INFO, message))
 
             all_devices_data[device.name] = device_ospf_data
-            context.test_result_collector.add_result(
-                status=ResultStatus.PASSED,
-                message=(
-                    f"The test successfully gathered OSPF neighbor state information "
-                    f"from device {device.name} using the *show ip ospf neighbor* "
-                    f"command. All data was retrieved and parsed correctly. This behavior "
-                    f"is as expected for this test phase."
-                ),
+            message = (
+                f"The test successfully gathered OSPF neighbor state information "
+                f"from device {device.name} using the *show ip ospf neighbor* "
+                f"command. All data was retrieved and parsed correctly. This behavior "
+                f"is as expected for this test phase."
             )
+            add_pending_result((ResultStatus.PASSED, message))
+            context.test_result_collector.add_results(pending_results)
 
         return all_devices_data
 
@@ -203,9 +210,16 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
         context: Context,
     ) -> None:
         """Compare the current state of each device to the expected parameters for each device."""
-        logger.info("Validating current state of devices against expected parameters")
+        # Bind the logging call locally, as it is made several times per neighbor,
+        # and check the level once so per-neighbor messages can be skipped entirely
+        log_info = logger.info
+        log_info_enabled = logger.isEnabledFor(logging.INFO)
+        log_info("Validating current state of devices against expected parameters")
+        # Index current neighbor values by (device, interface, neighbor ID) so each
+        # comparison below is a single lookup rather than a nested traversal
+        current_values = flatten_neighbor_state(current_state, "state")
         for expected_device_name, expected_device_data in expected_parameters.items():
-            logger.info("Checking current state of device %s", expected_device_name)
+            log_info("Checking current state of device %s", expected_device_name)
             if expected_device_name not in current_state:
                 msg = (
                     f"The test expected to find device {expected_device_name} in the "
@@ -220,23 +234,42 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
                 self.failed(msg)
                 continue
 
-            context.test_result_collector.add_result(
-                status=ResultStatus.PASSED,
-                message=(
-                    f"The test successfully verified that device {expected_device_name} "
-                    f"exists in the current network state and is accessible. This "
-                    f"behavior is as expected."
-                ),
+            # Buffer results and hand them to the collector once per device
+            pending_results: list[tuple[ResultStatus, str]] = []
+            add_pending_result = pending_results.append
+            message = (
+                f"The test successfully verified that device {expected_device_name} "
+                f"exists in the current network state and is accessible. This "
+                f"behavior is as expected."
             )
+            add_pending_result((ResultStatus.PASSED, message))
+
+            # A device with no OSPF neighbors at all fails every expected interface,
+            # so report that once rather than walking the expected parameters
+            current_device_data = current_state[expected_device_name]
+            if not current_device_data and expected_device_data:
+                msg = (
+                    f"The test expected device {expected_device_name} to have OSPF "
+                    f"neighbors on {len(expected_device_data)} interface(s), but the "
+                    f"device currently has no OSPF interfaces with active neighbors. "
+                    f"This could indicate that the OSPF process is down or has been "
+                    f"removed, or that all neighbor relationships have been lost. This "
+                    f"behavior is unexpected, so this test case must fail."
+                )
+                add_pending_result((ResultStatus.FAILED, msg))
+                context.test_result_collector.add_results(pending_results)
+                pending_results.clear()
+                self.failed(msg)
+                continue
 
             # Compare each interface and neighbor
             for interface_name, interface_data in expected_device_data.items():
-                logger.info(
+                log_info(
                     "Checking current state of interface %s on device %s",
                     interface_name,
                     expected_device_name,
                 )
-                if interface_name not in current_state[expected_device_name]:
+                if interface_name not in current_device_data:
                     msg = (
                         f"The test expected to find interface {interface_name} on device "
                         f"{expected_device_name}, but this interface was not present in "
@@ -245,28 +278,30 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
                         f"or OSPF process issue on this interface. This behavior is "
                         f"unexpected, so this test case must fail."
                     )
-                    context.test_result_collector.add_result(
-                        status=ResultStatus.FAILED, message=msg
-                    )
+                    add_pending_result((ResultStatus.FAILED, msg))
+                    context.test_result_collector.add_results(pending_results)
+                    pending_results.clear()
                     self.failed(msg)
                     continue
 
-                context.test_result_collector.add_result(
-                    status=ResultStatus.PASSED,
-                    message=(
-                        f"On device {expected_device_name}, the test verified that "
-                        f"interface {interface_name} exists and has active OSPF neighbors. "
-                        f"This confirms the interface is operational and participating in "
-                        f"the OSPF process. This behavior is as expected."
-                    ),
+                message = (
+                    f"On device {expected_device_name}, the test verified that "
+                    f"interface {interface_name} exists and has active OSPF neighbors. "
+                    f"This confirms the interface is operational and participating in "
+                    f"the OSPF process. This behavior is as expected."
                 )
+                add_pending_result((ResultStatus.PASSED, message))
 
                 expected_neighbors = interface_data.get("neighbors", {})
-                actual_neighbors = current_state[expected_device_name][
-                    interface_name
-                ].get("neighbors", {})
+                actual_neighbors = current_device_data[interface_name].get(
+                    "neighbors", {}
+                )
+                # Shared opening of the per-interface and per-neighbor messages below
+                interface_prefix = (
+                    f"On device {expected_device_name}, interface {interface_name}"
+                )
 
-                logger.info(
+                log_info(
                     "Comparing %d expected neighbors against %d current neighbors for interface "
                     "%s on device %s",
                     len(expected_neighbors),
@@ -274,58 +309,71 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
                     interface_name,
                     expected_device_name,
                 )
-                context.test_result_collector.add_result(
-                    status=ResultStatus.INFO,
-                    message=(
-                        f"On device {expected_device_name}, interface {interface_name} "
-                        f"currently has {len(actual_neighbors)} OSPF neighbors, while the "
-                        f"expected number of neighbors is {len(expected_neighbors)}. This "
-                        f"information will be used for detailed comparison."
-                    ),
+                message = (
+                    f"{interface_prefix} "
+                    f"currently has {len(actual_neighbors)} OSPF neighbors, while the "
+                    f"expected number of neighbors is {len(expected_neighbors)}. This "
+                    f"information will be used for detailed comparison."
                 )
+                add_pending_result((ResultStatus.INFO, message))
 
-                # Compare each expected neighbor
-                for neighbor_id, expected_neighbor_data in expected_neighbors.items():
-                    logger.info(
-                        "Checking current state of neighbor %s on interface %s of device %s",
-                        neighbor_id,
-                        interface_name,
-                        expected_device_name,
+                # Report every missing neighbor at once, then compare the rest
+                missing_neighbor_ids = (
+                    expected_neighbors.keys() - actual_neighbors.keys()
+                )
+                for neighbor_id in sorted(missing_neighbor_ids):
+                    msg = (
+                        f"{interface_prefix} "
+                        f"is missing an expected OSPF neighbor with router ID "
+                        f"{neighbor_id}. This could indicate a connectivity issue, "
+                        f"OSPF configuration change, or that the neighbor router is "
+                        f"down. This behavior is unexpected, so this test case must fail."
+                    )
+                    add_pending_result((ResultStatus.FAILED, msg))
+                if missing_neighbor_ids:
+                    context.test_result_collector.add_results(pending_results)
+                    pending_results.clear()
+                    self.failed(
+                        f"{interface_prefix} "
+                        f"is missing {len(missing_neighbor_ids)} expected OSPF "
+                        "neighbor(s)."
                     )
-                    if neighbor_id not in actual_neighbors:
-                        msg = (
-                            f"On device {expected_device_name}, interface {interface_name} "
-                            f"is missing an expected OSPF neighbor with router ID "
-                            f"{neighbor_id}. This could indicate a connectivity issue, "
-                            f"OSPF configuration change, or that the neighbor router is "
-                            f"down. This behavior is unexpected, so this test case must fail."
-                        )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.FAILED, message=msg
-                        )
-                        self.failed(msg)
-                        continue
 
-                    logger.info(
-                        f"Found expected neighbor {neighbor_id} on interface {interface_name} "
-                        f"for device {expected_device_name}"
+                # Compare each expected neighbor that is present
+                for neighbor_id, expected_neighbor_data in expected_neighbors.items():
+                    current_neighbor_state = current_values.get(
+                        (expected_device_name, interface_name, neighbor_id), MISSING
                     )
+                    if current_neighbor_state is MISSING:
+                        continue
 
-                    current_neighbor_data = actual_neighbors[neighbor_id]
-                    current_neighbor_state = current_neighbor_data.get("state")
+                    if log_info_enabled:
+                        log_info(
+                            "Checking current state of neighbor %s on interface %s of device %s",
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                        )
+                        log_info(
+                            "Found expected neighbor %s on interface %s for device %s",
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                        )
                     expected_neighbor_state = expected_neighbor_data.get("state")
-                    logger.info(
-                        "Comparing current state '%s' of neighbor %s on interface %s of device %s "
-                        "against expected state '%s'",
-                        current_neighbor_state,
-                        neighbor_id,
-                        interface_name,
-                        expected_device_name,
-                        expected_neighbor_state,
-                    )
+                    if log_info_enabled:
+                        log_info(
+                            "Comparing current state '%s' of neighbor %s on interface %s of device %s "
+                            "against expected state '%s'",
+                            current_neighbor_state,
+                            neighbor_id,
+                            interface_name,
+                            expected_device_name,
+                            expected_neighbor_state,
+                        )
                     if current_neighbor_state != expected_neighbor_state:
                         msg = (
-                            f"On device {expected_device_name}, interface {interface_name}, "
+                            f"{interface_prefix}, "
                             f"the OSPF neighbor with router ID {neighbor_id} is in state "
                             f"*{current_neighbor_state}*, which does not match the expected "
                             f"state of *{expected_neighbor_state}*. This could indicate a "
@@ -334,26 +382,30 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
                             f"in a FULL state for proper routing operation. This behavior is "
                             f"unexpected, so this test case must fail."
                         )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.FAILED, message=msg
-                        )
+                        add_pending_result((ResultStatus.FAILED, msg))
+                        context.test_result_collector.add_results(pending_results)
+                        pending_results.clear()
                         self.failed(msg)
                     else:
-                        logger.info(
-                            f"The current state of neighbor {neighbor_id} on interface "
-                            f"{interface_name} is {current_neighbor_state}, which matches the "
-                            f"expected state of this neighbor which is {expected_neighbor_state}"
-                        )
-                        context.test_result_collector.add_result(
-                            status=ResultStatus.PASSED,
-                            message=(
-                                f"On device {expected_device_name}, interface {interface_name}, "
-                                f"the OSPF neighbor with router ID {neighbor_id} is in the "
-                                f"expected state of *{current_neighbor_state}*. This confirms "
-                                f"that the OSPF adjacency is properly established and "
-                                f"functioning. This behavior is as expected."
-                            ),
+                        if log_info_enabled:
+                            log_info(
+                                "The current state of neighbor %s on interface %s is %s, "
+                                "which matches the expected state of this neighbor which is %s",
+                                neighbor_id,
+                                interface_name,
+                                current_neighbor_state,
+                                expected_neighbor_state,
+                            )
+                        message = (
+                            f"{interface_prefix}, "
+                            f"the OSPF neighbor with router ID {neighbor_id} is in the "
+                            f"expected state of *{current_neighbor_state}*. This confirms "
+                            f"that the OSPF adjacency is properly established and "
+                            f"functioning. This behavior is as expected."
                         )
+                        add_pending_result((ResultStatus.PASSED, message))
+
+            context.test_result_collector.add_results(pending_results)
 
     @aetest.test
     def verify_ospf_neighbors_status(self, context: Context):
@@ -370,27 +422,14 @@ class VerifyOSPFNeighborsStatus(aetest.Testcase):
         )
 
 
-class CommonCleanup(aetest.CommonCleanup):
+class CommonCleanup(StandardCommonCleanup):
     """Cleanup for script."""
 
-    @aetest.subsection
-    def add_results_to_report(self, context: Context):
-        """Add accumulated results to the HTML report."""
-        if context.mode == RunningMode.TESTING:
-            generate_job_report(
-                task_id="ospf_neighbors_status_detailed",
-                title="OSPF IPv4 Neighbors Status",
-                description=DESCRIPTION,
-                setup=SETUP,
-                procedure=PROCEDURE,
-                pass_fail_criteria=PASS_FAIL_CRITERIA,
-                results=context.test_result_collector.results,
-                command_executions=context.test_result_collector.command_executions,
-                status=context.test_result_collector.status,
-                parameters=context.testbed_adapter.parameters,
-            )
-
-    @aetest.subsection
-    def disconnect_from_devices(self, context: Context):
-        """Disconnect from all devices in the testbed."""
-        disconnect_from_testbed_devices(context.testbed_adapter)
+    report_config = {
+        "task_id": "ospf_neighbors_status_detailed",
+        "title": "OSPF IPv4 Neighbors Status",
+        "description": DESCRIPTION,
+        "setup": SETUP,
+        "procedure": PROCEDURE_TEMPLATE,
+        "pass_fail_criteria": PASS_FAIL_CRITERIA,
+    }
@@ -1,6 +1,8 @@
 """Primary entrypoint for pyATS job execution."""
 
+import functools
 import logging
+import os
 from pathlib import Path
 
 import yaml
@@ -19,6 +21,57 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Prefer the libyaml-backed loader, falling back to the pure-Python loader when
+# PyYAML was built without libyaml
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# String form of PARAMETERS_DIR, so parameters file paths can be built with a
+# plain string join rather than through pathlib
+PARAMETERS_DIR_STR = str(PARAMETERS_DIR)
+
+
+@functools.cache
+def get_jobfile_path(base_jobfile_directory: str, jobfile: str) -> str:
+    """Get the full path of a jobfile relative to the base jobfile directory.
+
+    Several test cases commonly share one jobfile, so results are memoized.
+    """
+    return os.path.join(base_jobfile_directory, jobfile)
+
+
+def get_test_case_paths(
+    test_case_identifier: str, test_case_data: dict, base_jobfile_directory: str
+) -> tuple[str, str, str]:
+    """Work out the task ID, jobfile path, and parameters file path of a test case.
+
+    Args:
+        test_case_identifier: Identifier of the test case in the test plan
+        test_case_data: Test case definition from the test plan
+        base_jobfile_directory: Directory jobfile paths are relative to
+
+    Returns:
+        Tuple of the task ID, jobfile path, and fully qualified parameters file path
+    """
+    title = test_case_data["title"]
+    jobfile = test_case_data["jobfile"]
+    explicit_parameters_file = test_case_data.get("parameters_file")
+
+    # Construct task ID
+    task_id = f"{test_case_identifier} - {title}"
+    # Construct full jobfile path relative to the base jobfile directory
+    jobfile_path = get_jobfile_path(base_jobfile_directory, jobfile)
+    # Construct parameters filename if one is not defined
+    if explicit_parameters_file:
+        parameters_file = explicit_parameters_file
+    else:
+        sanitized_test_case_identifier = test_case_identifier.replace(".", "_")
+        sanitized_jobfile_name = jobfile.replace(".py", "")
+        parameters_file = (
+            f"{sanitized_test_case_identifier}_{sanitized_jobfile_name}_parameters.json"
+        )
+
+    return task_id, jobfile_path, os.path.join(PARAMETERS_DIR_STR, parameters_file)
+
 
 def main(runtime):
     """
@@ -33,42 +86,46 @@ def main(runtime):
     # Parse command-line arguments
     args, unknown = define_parser().parse_known_args()
 
-    logger.info(f"Running in {str(args.mode)} mode")
+    logger.info("Running in %s mode", args.mode)
 
-    # Validate provided test plan path exists
+    # Only canonicalize the test plan path if it is relative
     raw_test_plan_path = args.test_plan
-    test_plan_path = Path(raw_test_plan_path).resolve()
+    test_plan_path = Path(raw_test_plan_path)
+    if not test_plan_path.is_absolute():
+        test_plan_path = test_plan_path.resolve()
     logger.info("Test plan filepath provided is '%s'", test_plan_path)
-    if not test_plan_path.exists():
-        logger.error("Test plan file does not exist: %s", test_plan_path)
-        raise FileNotFoundError(f"Test plan file does not exist: {test_plan_path}")
-
-    # Load test plan from YAML file
-    with open(test_plan_path, "r") as f:
-        test_plan = yaml.safe_load(f)
-
-    base_jobfile_directory = Path(test_plan["jobfile_directory"]).resolve()
-
-    for test_case_identifier, test_case_data in test_plan["test_cases"].items():
-        # Construct task ID
-        task_id = f"{test_case_identifier} - {test_case_data['title']}"
-        # Construct full jobfile path relative to the base jobfile directory
-        jobfile_path = base_jobfile_directory / test_case_data["jobfile"]
-        # Construct parameters filename if one is not defined
-        explicit_parameters_file = test_case_data.get("parameters_file")
-        if explicit_parameters_file:
-            parameters_file = explicit_parameters_file
-        else:
-            sanitized_test_case_identifier = test_case_identifier.replace(".", "_")
-            sanitized_jobfile_name = test_case_data["jobfile"].replace(".py", "")
-            parameters_file = (
-                f"{sanitized_test_case_identifier}_"
-                f"{sanitized_jobfile_name}_"
-                "parameters.json"
-            )
-
-        fully_qualified_parameters_file = str(PARAMETERS_DIR / parameters_file)
 
+    # Load test plan from YAML file, letting open() report a missing file
+    try:
+        with open(test_plan_path, "rb") as f:
+            test_plan = yaml.load(f, Loader=YAML_LOADER)
+    except FileNotFoundError:
+        logger.error("Test plan file does not exist: %s", test_plan_path)
+        raise FileNotFoundError(
+            f"Test plan file does not exist: {test_plan_path}"
+        ) from None
+
+    base_jobfile_directory = str(Path(test_plan["jobfile_directory"]).resolve())
+
+    # Work out every test case's task ID and file paths up front
+    prepared_test_cases = [
+        (
+            test_case_identifier,
+            test_case_data,
+            *get_test_case_paths(
+                test_case_identifier, test_case_data, base_jobfile_directory
+            ),
+        )
+        for test_case_identifier, test_case_data in test_plan["test_cases"].items()
+    ]
+
+    for (
+        test_case_identifier,
+        test_case_data,
+        task_id,
+        jobfile_path,
+        fully_qualified_parameters_file,
+    ) in prepared_test_cases:
         logger.info(
             "Executing test case '%s' tied to jobfile at '%s'", task_id, jobfile_path
         )
@@ -84,7 +141,7 @@ def main(runtime):
         )
 
         run(
-            testscript=str(jobfile_path),
+            testscript=jobfile_path,
             runtime=runtime,
             context=context,
             task_id=task_id,
@@ -0,0 +1,64 @@
+"""Tests for the pyATS testbed and device adapters."""
+
+from types import SimpleNamespace
+
+from utils import adapters
+
+
+class FakeDevice:
+    """Minimal stand-in for a pyATS Device, recording executed commands."""
+
+    def __init__(self, name: str, outputs: str | dict[str, str] = ""):
+        self.name = name
+        self.os = "iosxe"
+        self.type = "router"
+        self.outputs = outputs
+        self.executed: list = []
+
+    def execute(self, commands):
+        self.executed.append(commands)
+        return self.outputs
+
+
+def make_device_adapter(outputs: str | dict[str, str] = "") -> adapters.DeviceAdapter:
+    """Create a DeviceAdapter around a FakeDevice."""
+    device = FakeDevice("R1", outputs)
+    return adapters.DeviceAdapter(
+        device, adapters.TestbedAdapter(SimpleNamespace(devices={}))
+    )
+
+
+def test_execute_many_normalizes_single_command_output():
+    """Unicon's plain string output for a single command becomes a dictionary."""
+    adapter = make_device_adapter("output")
+    assert adapter.execute_many(["show version"]) == {"show version": "output"}
+    assert adapter.device.executed == [["show version"]]
+
+
+def test_execute_many_returns_dictionary_output_unchanged():
+    """Output for several commands is returned as Unicon gives it."""
+    outputs = {"show version": "version", "show clock": "clock"}
+    adapter = make_device_adapter(outputs)
+    assert adapter.execute_many(["show version", "show clock"]) == outputs
+    assert adapter.device.executed == [["show version", "show clock"]]
+
+
+def test_testbed_devices_reuses_adapters():
+    """Device adapters are built once and reused on later accesses."""
+    testbed = SimpleNamespace(devices={"R1": FakeDevice("R1")})
+    adapter = adapters.TestbedAdapter(testbed)
+    assert adapter.devices["R1"] is adapter.devices["R1"]
+
+
+def test_testbed_devices_rebuilt_when_device_replaced():
+    """Replacing a device with another keeps the count but rebuilds the adapters."""
+    testbed = SimpleNamespace(devices={"R1": FakeDevice("R1"), "R2": FakeDevice("R2")})
+    adapter = adapters.TestbedAdapter(testbed)
+    r1_adapter = adapter.devices["R1"]
+
+    del testbed.devices["R2"]
+    testbed.devices["R3"] = FakeDevice("R3")
+
+    assert set(adapter.devices) == {"R1", "R3"}
+    assert adapter.devices["R1"] is r1_adapter
+    assert adapter.devices["R3"].device is testbed.devices["R3"]
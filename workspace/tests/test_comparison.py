@@ -0,0 +1,37 @@
+"""Tests for the state comparison helpers."""
+
+from utils.comparison import flatten_neighbor_state
+
+STATE = {
+    "R1": {
+        "GigabitEthernet2": {
+            "neighbors": {
+                "100.1.1.2": {"state": "FULL/DR", "priority": 1},
+                "100.1.1.3": {"state": "FULL/BDR"},
+            }
+        },
+        "Loopback0": {},
+    },
+    "R2": {},
+}
+
+
+def test_flatten_neighbor_state():
+    """Each neighbor's field is indexed by (device, interface, neighbor ID)."""
+    assert flatten_neighbor_state(STATE, "state") == {
+        ("R1", "GigabitEthernet2", "100.1.1.2"): "FULL/DR",
+        ("R1", "GigabitEthernet2", "100.1.1.3"): "FULL/BDR",
+    }
+
+
+def test_flatten_neighbor_state_missing_field_is_none():
+    """A neighbor without the requested field is indexed with a None value."""
+    assert flatten_neighbor_state(STATE, "priority") == {
+        ("R1", "GigabitEthernet2", "100.1.1.2"): 1,
+        ("R1", "GigabitEthernet2", "100.1.1.3"): None,
+    }
+
+
+def test_flatten_neighbor_state_empty():
+    """Empty state produces an empty index."""
+    assert flatten_neighbor_state({}, "state") == {}
@@ -0,0 +1,91 @@
+"""Tests for running commands on devices through the per-test-case cache."""
+
+from types import SimpleNamespace
+
+from utils import adapters, results
+from utils.connectivity import run_command_on_device, run_commands_on_device
+from utils.context import Context
+from utils.types import RunningMode
+
+
+class FakeDevice:
+    """Minimal stand-in for a pyATS Device, recording executed commands."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.os = "iosxe"
+        self.type = "router"
+        self.executed: list = []
+
+    def execute(self, commands):
+        self.executed.append(commands)
+        if isinstance(commands, list):
+            if len(commands) == 1:
+                return f"output of {commands[0]}"
+            return {command: f"output of {command}" for command in commands}
+        return f"output of {commands}"
+
+    def parse(self, command, output):
+        return {"command": command, "output": output}
+
+
+def make_context() -> tuple[Context, adapters.DeviceAdapter]:
+    """Create a context around a testbed holding a single FakeDevice."""
+    testbed_adapter = adapters.TestbedAdapter(
+        SimpleNamespace(devices={"R1": FakeDevice("R1")})
+    )
+    context = Context(
+        test_case_identifier="test",
+        test_case_title="Test",
+        task_id="task",
+        mode=RunningMode.TESTING,
+        testbed_adapter=testbed_adapter,
+        test_result_collector=results.TestResultCollector(),
+        parameters_file="parameters.json",
+    )
+    return context, testbed_adapter.get_device("R1")
+
+
+def test_run_command_on_device_uses_cache():
+    """A command is sent to a device only once per test case execution."""
+    context, device = make_context()
+
+    first = run_command_on_device("show version", device, context)
+    second = run_command_on_device("show version", device, context)
+
+    assert second is first
+    assert device.device.executed == ["show version"]
+    assert len(context.test_result_collector.command_executions) == 1
+
+
+def test_run_commands_on_device_only_sends_uncached_commands():
+    """Cached commands are served from the cache, the rest are sent in one batch."""
+    context, device = make_context()
+    cached = run_command_on_device("show version", device, context)
+
+    results = run_commands_on_device(
+        ["show version", "show clock", "show users"], device, context
+    )
+
+    assert results["show version"] is cached
+    assert results["show clock"].output == "output of show clock"
+    assert results["show users"].data == {
+        "command": "show users",
+        "output": "output of show users",
+    }
+    assert device.device.executed == ["show version", ["show clock", "show users"]]
+    assert set(context.command_cache) == {
+        ("R1", "show version"),
+        ("R1", "show clock"),
+        ("R1", "show users"),
+    }
+
+
+def test_run_commands_on_device_all_cached():
+    """Nothing is sent to the device when every command is already cached."""
+    context, device = make_context()
+    run_commands_on_device(["show clock"], device, context)
+
+    run_commands_on_device(["show clock"], device, context)
+
+    assert device.device.executed == [["show clock"]]
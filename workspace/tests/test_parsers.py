@@ -0,0 +1,68 @@
+"""Tests for the lightweight command output parsers."""
+
+from utils.parsers import parse_ospf_neighbor
+
+OSPF_NEIGHBOR_OUTPUT = """\
+Neighbor ID     Pri   State           Dead Time   Address         Interface
+100.1.1.2         1   FULL/DR         00:00:38    10.1.2.2        GigabitEthernet2
+100.1.1.4         0   FULL/  -        00:00:31    10.1.4.4        GigabitEthernet3
+"""
+
+
+def test_parse_ospf_neighbor():
+    """Every neighbor row is parsed into the Genie-shaped structure."""
+    assert parse_ospf_neighbor(OSPF_NEIGHBOR_OUTPUT) == {
+        "interfaces": {
+            "GigabitEthernet2": {
+                "neighbors": {
+                    "100.1.1.2": {
+                        "priority": 1,
+                        "state": "FULL/DR",
+                        "dead_time": "00:00:38",
+                        "address": "10.1.2.2",
+                    }
+                }
+            },
+            "GigabitEthernet3": {
+                "neighbors": {
+                    "100.1.1.4": {
+                        "priority": 0,
+                        "state": "FULL/  -",
+                        "dead_time": "00:00:31",
+                        "address": "10.1.4.4",
+                    }
+                }
+            },
+        }
+    }
+
+
+def test_parse_ospf_neighbor_unrecognized_row_falls_back():
+    """A row the parser does not recognize makes it give up entirely.
+
+    Returning an empty dictionary makes callers fall back to Genie, rather than
+    reporting the unrecognized neighbor as missing.
+    """
+    output = (
+        OSPF_NEIGHBOR_OUTPUT
+        + "100.1.1.5         1   FULL/BDR        00:00:35    10.1.5.5\n"
+    )
+    assert parse_ospf_neighbor(output) == {}
+
+
+def test_parse_ospf_neighbor_abbreviated_interface_falls_back():
+    """An abbreviated interface name makes the parser give up entirely.
+
+    Genie expands names such as "Gi3.10" to "GigabitEthernet3.10", which is how
+    they appear in the learned parameter files.
+    """
+    output = (
+        OSPF_NEIGHBOR_OUTPUT
+        + "100.1.1.5         1   FULL/BDR        00:00:35    10.1.5.5        Gi3.10\n"
+    )
+    assert parse_ospf_neighbor(output) == {}
+
+
+def test_parse_ospf_neighbor_no_neighbors():
+    """Output without any neighbors is left for Genie to parse."""
+    assert parse_ospf_neighbor("") == {}
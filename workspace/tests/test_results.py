@@ -0,0 +1,56 @@
+"""Tests for the test result collector."""
+
+from utils import results
+from utils.types import Result, ResultStatus
+
+
+def test_status_is_passed_without_results():
+    """An empty collector reports an overall PASSED status."""
+    assert results.TestResultCollector().status == ResultStatus.PASSED
+
+
+def test_status_ignores_passed_and_info_results():
+    """PASSED and INFO results leave the overall status at PASSED."""
+    collector = results.TestResultCollector()
+    collector.add_result(ResultStatus.INFO, "informational")
+    collector.add_result(ResultStatus.PASSED, "passed")
+    assert collector.status == ResultStatus.PASSED
+
+
+def test_status_is_first_failing_result():
+    """The first non-PASSED, non-INFO result determines the overall status."""
+    collector = results.TestResultCollector()
+    collector.add_result(ResultStatus.PASSED, "passed")
+    collector.add_result(ResultStatus.SKIPPED, "skipped")
+    collector.add_result(ResultStatus.FAILED, "failed")
+    assert collector.status == ResultStatus.SKIPPED
+
+
+def test_add_results_keeps_order_and_updates_status():
+    """Results added in bulk are stored in order and update the overall status."""
+    collector = results.TestResultCollector()
+    collector.add_result(ResultStatus.PASSED, "first")
+    collector.add_results(
+        [
+            (ResultStatus.INFO, "second"),
+            (ResultStatus.FAILED, "third"),
+            (ResultStatus.ERRORED, "fourth"),
+        ]
+    )
+    assert collector.results == [
+        Result(ResultStatus.PASSED, "first"),
+        Result(ResultStatus.INFO, "second"),
+        Result(ResultStatus.FAILED, "third"),
+        Result(ResultStatus.ERRORED, "fourth"),
+    ]
+    assert collector.status == ResultStatus.FAILED
+
+
+def test_add_results_accepts_a_generator():
+    """add_results consumes any iterable of (status, message) pairs."""
+    collector = results.TestResultCollector()
+    collector.add_results(
+        (ResultStatus.PASSED, f"neighbor {index}") for index in range(3)
+    )
+    assert len(collector.results) == 3
+    assert collector.status == ResultStatus.PASSED
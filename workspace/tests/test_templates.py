@@ -0,0 +1,25 @@
+"""Tests for the Jinja2 template helpers."""
+
+from utils.templates import get_status_style
+from utils.types import ResultStatus
+
+
+def test_get_status_style_enum():
+    """A ResultStatus member maps to its CSS class and display text."""
+    assert get_status_style(ResultStatus.PASSED) == {
+        "css_class": "pass-status",
+        "display_text": "PASSED",
+    }
+
+
+def test_get_status_style_string():
+    """The string value of a status maps to the same style as the member."""
+    assert get_status_style("failed") == get_status_style(ResultStatus.FAILED)
+
+
+def test_get_status_style_unknown_status():
+    """An unknown status falls back to a neutral style showing the status."""
+    assert get_status_style("unknown") == {
+        "css_class": "neutral-status",
+        "display_text": "unknown",
+    }
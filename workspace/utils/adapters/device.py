@@ -1,12 +1,15 @@
 """Contains the adapter/facade for pyATS device objects."""
 
-from typing import TYPE_CHECKING, Any, cast
+import logging
+from typing import TYPE_CHECKING, Any
 
 from pyats.topology.device import Device as PyatsDevice
 
 if TYPE_CHECKING:
     from utils.adapters import TestbedAdapter
 
+logger = logging.getLogger(__name__)
+
 
 class DeviceAdapter:
     """Adapter for pyATS Device objects.
@@ -21,6 +24,17 @@ class DeviceAdapter:
         device (PyatsDevice): The underlying pyATS Device object
     """
 
+    __slots__ = (
+        "device",
+        "testbed_adapter",
+        "name",
+        "os",
+        "type",
+    )
+
+    # Attribute names already reported as falling back to __getattr__
+    _fallback_attributes: set[str] = set()
+
     def __init__(self, device: PyatsDevice, testbed_adapter: "TestbedAdapter"):
         """Initialize the device adapter.
 
@@ -29,26 +43,44 @@ class DeviceAdapter:
         """
         self.device = device
         self.testbed_adapter = testbed_adapter
+        # These do not change once the testbed is loaded, so read them only once
+        self.name: str = device.name
+        self.os: str = device.os
+        self.type: str = device.type
 
     @property
-    def name(self) -> str:
-        """Get the device name."""
-        return cast(str, self.device.name)
+    def connected(self) -> bool:
+        """Return whether the device is connected."""
+        return self.device.connected
+
+    # The attributes below can change after the testbed is loaded (connections
+    # are added at connect time, for example), so they are read through to the
+    # device on every access. Declaring them avoids the __getattr__ fallback.
 
     @property
-    def os(self) -> str:
-        """Get the device operating system."""
-        return cast(str, self.device.os)
+    def alias(self) -> str:
+        """Return the device alias."""
+        return self.device.alias
 
     @property
-    def type(self) -> str:
-        """Get the device type."""
-        return cast(str, self.device.type)
+    def connections(self) -> Any:
+        """Return the connection definitions of the device."""
+        return self.device.connections
 
     @property
-    def connected(self) -> bool:
-        """Return whether the device is connected."""
-        return cast(bool, self.device.connected)
+    def credentials(self) -> Any:
+        """Return the credentials of the device."""
+        return self.device.credentials
+
+    @property
+    def custom(self) -> Any:
+        """Return the custom attributes of the device."""
+        return self.device.custom
+
+    @property
+    def testbed(self) -> Any:
+        """Return the pyATS testbed the device belongs to."""
+        return self.device.testbed
 
     def connect(self, *, log_stdout: bool = True) -> None:
         """Connect to the device.
@@ -71,7 +103,23 @@ class DeviceAdapter:
         Returns:
             The command output as a string
         """
-        return cast(str, self.device.execute(command))
+        return self.device.execute(command)
+
+    def execute_many(self, commands: list[str]) -> dict[str, str]:
+        """Execute several commands on the device in a single call.
+
+        Args:
+            commands: The commands to execute, in order
+
+        Returns:
+            A dictionary mapping each command to its output
+        """
+        output = self.device.execute(list(commands))
+        # Unicon returns a plain string rather than a dictionary when only one
+        # command is given, so normalize the result here.
+        if isinstance(output, str):
+            return {commands[0]: output}
+        return output
 
     def parse(self, command: str, output: str | None = None) -> dict[str, Any]:
         """Parse the output of a command using the appropriate parser.
@@ -84,8 +132,8 @@ class DeviceAdapter:
             A dictionary containing the parsed output
         """
         if output is None:
-            return cast(dict[str, Any], self.device.parse(command))
-        return cast(dict[str, Any], self.device.parse(command, output=output))
+            return self.device.parse(command)
+        return self.device.parse(command, output=output)
 
     def configure(self, commands: str | list[str]) -> str:
         """Configure the device with one or more commands.
@@ -96,10 +144,17 @@ class DeviceAdapter:
         Returns:
             The configuration output
         """
-        return cast(str, self.device.configure(commands))
+        return self.device.configure(commands)
 
     def __getattr__(self, name: str) -> Any:
         """Pass through any other attributes to the underlying device object."""
+        if name not in self._fallback_attributes:
+            self._fallback_attributes.add(name)
+            logger.debug(
+                "Attribute '%s' is not forwarded by DeviceAdapter, looking it up on "
+                "the device instead",
+                name,
+            )
         return getattr(self.device, name)
 
     def __repr__(self) -> str:
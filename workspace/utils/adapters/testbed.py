@@ -1,11 +1,14 @@
 """Contains the adapter/facade for pyATS testbed objects."""
 
-from typing import Any, Iterator, cast
+import logging
+from typing import Any, Iterator
 
 from pyats.topology.testbed import Testbed as PyatsTestbed
 from utils.adapters.device import DeviceAdapter
 from utils.types import ParameterData
 
+logger = logging.getLogger(__name__)
+
 
 class TestbedAdapter:
     """Adapter for pyATS Testbed objects.
@@ -19,6 +22,9 @@ class TestbedAdapter:
         results: TestResultCollector for recording test results
     """
 
+    # Attribute names already reported as falling back to __getattr__
+    _fallback_attributes: set[str] = set()
+
     def __init__(self, testbed: PyatsTestbed):
         """Initialize the testbed adapter.
 
@@ -32,15 +38,46 @@ class TestbedAdapter:
     @property
     def name(self) -> str:
         """Get the testbed name."""
-        return cast(str, self.testbed.name)
+        return self.testbed.name
+
+    # The attributes below are read through to the testbed on every access, so
+    # they reflect any later changes. Declaring them avoids the __getattr__
+    # fallback.
+
+    @property
+    def alias(self) -> str:
+        """Get the testbed alias."""
+        return self.testbed.alias
+
+    @property
+    def credentials(self) -> Any:
+        """Get the credentials of the testbed."""
+        return self.testbed.credentials
+
+    @property
+    def custom(self) -> Any:
+        """Get the custom attributes of the testbed."""
+        return self.testbed.custom
+
+    @property
+    def servers(self) -> Any:
+        """Get the servers defined in the testbed."""
+        return self.testbed.servers
 
     @property
     def devices(self) -> dict[str, DeviceAdapter]:
         """Get a dictionary of device adapters."""
-        # Lazily create device adapters as needed
-        for device_name, device in self.testbed.devices.items():
-            if device_name not in self._device_adapters:
-                self._device_adapters[device_name] = DeviceAdapter(device, self)
+        # Build device adapters on first access, and only rebuild them if devices
+        # have since been added to or removed from the testbed. Comparing names
+        # rather than counts also catches a device being replaced by another.
+        # Existing adapters are reused so that callers holding on to them stay
+        # valid.
+        if self._device_adapters.keys() != self.testbed.devices.keys():
+            self._device_adapters = {
+                device_name: self._device_adapters.get(device_name)
+                or DeviceAdapter(device, self)
+                for device_name, device in self.testbed.devices.items()
+            }
         return self._device_adapters
 
     def get_device(self, device_name: str) -> DeviceAdapter:
@@ -55,9 +92,10 @@ class TestbedAdapter:
         Raises:
             KeyError: If the device is not found in the testbed
         """
-        if device_name not in self.devices:
+        device = self.devices.get(device_name)
+        if device is None:
             raise KeyError(f"Device {device_name} not found in testbed")
-        return self.devices[device_name]
+        return device
 
     def connect_device(self, device_name: str, *, log_stdout: bool = True) -> None:
         """Connect to a specific device.
@@ -84,8 +122,7 @@ class TestbedAdapter:
 
     def __iter__(self) -> Iterator[DeviceAdapter]:
         """Iterate over device adapters in the testbed."""
-        for device_name in self.testbed.devices:
-            yield self.devices[device_name]
+        return iter(self.devices.values())
 
     def __len__(self) -> int:
         """Return the number of devices in the testbed."""
@@ -97,6 +134,13 @@ class TestbedAdapter:
 
     def __getattr__(self, name: str) -> Any:
         """Pass through any other attributes to the underlying testbed object."""
+        if name not in self._fallback_attributes:
+            self._fallback_attributes.add(name)
+            logger.debug(
+                "Attribute '%s' is not forwarded by TestbedAdapter, looking it up on "
+                "the testbed instead",
+                name,
+            )
         return getattr(self.testbed, name)
 
     def __repr__(self) -> str:
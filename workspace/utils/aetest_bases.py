@@ -0,0 +1,118 @@
+"""Contains common setup and cleanup sections shared by pyATS test scripts.
+
+Job files subclass these and set the class attributes specific to them, rather
+than each defining the same subsections.
+"""
+
+import logging
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from pyats import aetest
+from utils.connectivity import (
+    connect_to_testbed_devices,
+    disconnect_from_testbed_devices,
+    run_commands_on_devices,
+    verify_testbed_device_connectivity,
+)
+from utils.context import Context
+from utils.parameters import (
+    load_parameters_from_file,
+    validate_parameters_directory_exists,
+)
+from utils.reports import start_job_report
+from utils.types import RunningMode
+
+logger = logging.getLogger(__name__)
+
+
+class StandardCommonSetup(aetest.CommonSetup):
+    """Setup shared by test scripts.
+
+    Attributes:
+        prefetch_commands: Commands run on every device during setup. Their
+            parsed output is cached on the context, so test cases do not
+            re-issue them.
+    """
+
+    prefetch_commands: list[str] = []
+
+    @aetest.subsection
+    def connect_to_devices(self, context: Context):
+        """Connect to all devices in the testbed."""
+        connect_to_testbed_devices(context.testbed_adapter)
+
+    @aetest.subsection
+    def verify_connected(self, context: Context):
+        """Verify that all devices are connected."""
+        verify_testbed_device_connectivity(context.testbed_adapter, self.failed)
+
+    @aetest.subsection
+    def ensure_parameters_directory_exists(self):
+        """Create parameters directory if it doesn't exist."""
+        validate_parameters_directory_exists(self.failed)
+
+    @aetest.subsection
+    def load_expected_parameters(self, context: Context):
+        """Load the expected parameters before any command is run in testing mode."""
+        if context.mode == RunningMode.TESTING:
+            context.testbed_adapter.parameters = load_parameters_from_file(
+                context.parameters_file
+            )
+
+    @aetest.subsection
+    def prefetch_command_outputs(self, context: Context):
+        """Run every command this test case needs on all devices in one batch."""
+        # Without expected parameters the test case fails without gathering any
+        # state, so there is nothing to prefetch
+        if (
+            context.mode == RunningMode.TESTING
+            and not context.testbed_adapter.parameters
+        ):
+            logger.warning("No expected parameters found, skipping command prefetch")
+            return
+        if self.prefetch_commands:
+            run_commands_on_devices(
+                self.prefetch_commands,
+                context=context,
+                testbed=context.testbed_adapter,
+            )
+
+
+class StandardCommonCleanup(aetest.CommonCleanup):
+    """Cleanup shared by test scripts.
+
+    Attributes:
+        report_config: Keyword arguments for generate_job_report that are
+            specific to the test script (task_id, title, description, setup,
+            procedure and pass_fail_criteria)
+    """
+
+    report_config: dict[str, Any] = {}
+
+    # Report being rendered in the background while devices are disconnected
+    report_future: Future[Path] | None = None
+
+    @aetest.subsection
+    def add_results_to_report(self, context: Context):
+        """Add accumulated results to the HTML report."""
+        if context.mode == RunningMode.TESTING:
+            self.report_future = start_job_report(
+                **self.report_config,
+                results=context.test_result_collector.results,
+                command_executions=context.test_result_collector.command_executions,
+                status=context.test_result_collector.status,
+                parameters=context.testbed_adapter.parameters,
+            )
+
+    @aetest.subsection
+    def disconnect_from_devices(self, context: Context):
+        """Disconnect from all devices in the testbed."""
+        disconnect_from_testbed_devices(context.testbed_adapter)
+
+    @aetest.subsection
+    def wait_for_report(self):
+        """Wait for the HTML report to finish being written."""
+        if self.report_future is not None:
+            self.report_future.result()
@@ -0,0 +1,30 @@
+"""Contains helpers for comparing device state against expected parameters."""
+
+from typing import Any
+
+from utils.types import ParameterData
+
+# Returned by lookups into a flattened state index when a key is absent, so
+# that a legitimately missing (None) neighbor field can still be told apart.
+MISSING = object()
+
+
+def flatten_neighbor_state(
+    state: ParameterData, field: str
+) -> dict[tuple[str, str, str], Any]:
+    """Flatten per-device OSPF neighbor state into a single-level index.
+
+    Args:
+        state: Nested state keyed by device, then interface, with each interface
+            holding a "neighbors" dictionary keyed by neighbor router ID
+        field: The neighbor field to extract (e.g. "state" or "priority")
+
+    Returns:
+        Dictionary mapping (device, interface, neighbor ID) to the field value
+    """
+    return {
+        (device_name, interface_name, neighbor_id): neighbor_data.get(field)
+        for device_name, interfaces in state.items()
+        for interface_name, interface_data in interfaces.items()
+        for neighbor_id, neighbor_data in interface_data.get("neighbors", {}).items()
+    }
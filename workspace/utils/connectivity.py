@@ -3,21 +3,62 @@
 These are often used as part of pyATS test script setup and teardown sections.
 """
 
+import atexit
 import concurrent.futures
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable
+from typing import Any, Callable
 
 from utils.adapters import DeviceAdapter, TestbedAdapter
+from utils.constants import MAX_COMMAND_WORKERS
 from utils.context import Context
+from utils.parsers import FAST_PARSERS
 
 logger = logging.getLogger(__name__)
 
+# Worker pool shared by every per-device fan-out within a job (connecting,
+# running commands and disconnecting), so threads are started once per job
+# rather than once per call. Each job runs in its own process, so the pool is
+# created lazily on first use and shut down when the process exits.
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _shutdown_executor() -> None:
+    """Shuts down the shared executor, waiting for queued work to finish."""
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+
+
+atexit.register(_shutdown_executor)
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns the shared executor, creating it on first use.
+
+    The pool is created once with MAX_COMMAND_WORKERS workers and never replaced,
+    so callers can keep submitting to it concurrently. Worker threads are only
+    started as work is submitted, so small testbeds do not start idle threads.
+    Any devices beyond MAX_COMMAND_WORKERS are queued until a worker is free.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_COMMAND_WORKERS, thread_name_prefix="pyats-io"
+            )
+        return _executor
+
 
 def connect_to_device(device: DeviceAdapter) -> None:
-    """Connect to a device in a testbed."""
+    """Connect to a device in a testbed, reusing an existing connection."""
+    if device.connected:
+        logger.info("Already connected to device %s, reusing connection", device.name)
+        return
+
     logger.info("Connecting to device %s", device.name)
     start_time = time.time()
     device.connect(log_stdout=False)
@@ -30,25 +71,47 @@ def connect_to_device(device: DeviceAdapter) -> None:
 
 
 def connect_to_testbed_devices(testbed: TestbedAdapter) -> None:
-    """Connect to devices within a testbed."""
+    """Connect to devices within a testbed.
+
+    A device that cannot be connected to is logged and skipped, rather than
+    aborting the remaining connections, so that verify_testbed_device_connectivity
+    can report every device that failed.
+    """
     logger.info("Connecting to devices in testbed")
 
     device_list = list(testbed)
 
     start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=len(device_list)
-    ) as executor:
-        # Submit all device connection tasks to the executor
-        futures = [executor.submit(connect_to_device, device) for device in device_list]
-
-        # Wait for all tasks to complete
-        concurrent.futures.wait(futures)
+    executor = _get_executor()
+    # Submit all device connection tasks to the executor
+    future_to_device = {
+        executor.submit(connect_to_device, device): device for device in device_list
+    }
+
+    # Collect results as they complete, logging each failure as soon as it is
+    # known
+    failed_devices = 0
+    for future in concurrent.futures.as_completed(future_to_device):
+        device = future_to_device[future]
+        try:
+            future.result()
+        except Exception as exc:
+            logger.error("Failed to connect to device %s: %s", device.name, exc)
+            failed_devices += 1
 
     total_time = time.time() - start_time
-    logger.info(
-        "Successfully connected to all devices in testbed in %.2f seconds", total_time
-    )
+    if failed_devices:
+        logger.warning(
+            "Failed to connect to %d of %d devices in testbed in %.2f seconds",
+            failed_devices,
+            len(device_list),
+            total_time,
+        )
+    else:
+        logger.info(
+            "Successfully connected to all devices in testbed in %.2f seconds",
+            total_time,
+        )
 
 
 def verify_testbed_device_connectivity(
@@ -74,21 +137,27 @@ class CommandExecutionResult:
     data: dict[str, Any]
 
 
-def run_command_on_device(
-    command: str, device: DeviceAdapter, context: Context
+def _process_command_output(
+    command: str, output: str, device: DeviceAdapter, context: Context
 ) -> CommandExecutionResult:
-    """Runs a command on a device and parses the output."""
-    output = device.execute(command)
+    """Parses the output of a command, records it, and caches the result."""
     logger.info(
         "Output of command '%s' from device %s:\n\n%s\n", command, device.name, output
     )
-    data = device.parse(command, output=output)
-    logger.info(
-        "Parsed data resulting from output of command '%s' from device %s:\n\n%s\n",
-        command,
-        device.name,
-        json.dumps(data, indent=4),
-    )
+    # Prefer a lightweight parser when one exists for this command, falling back
+    # to Genie if it does not recognize the output.
+    fast_parser = FAST_PARSERS.get(command)
+    data = fast_parser(output) if fast_parser is not None else {}
+    if not data:
+        data = device.parse(command, output=output)
+    # Only serialize the parsed data if it is actually going to be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Parsed data resulting from output of command '%s' from device %s:\n\n%s\n",
+            command,
+            device.name,
+            json.dumps(data, indent=4),
+        )
 
     # Record this command execution
     context.test_result_collector.add_command_execution(
@@ -98,12 +167,76 @@ def run_command_on_device(
         data=data,
     )
 
-    return CommandExecutionResult(
+    result = CommandExecutionResult(
         device=device,
         command=command,
         output=output,
         data=data,
     )
+    context.command_cache[(device.name, command)] = result
+    return result
+
+
+def run_command_on_device(
+    command: str, device: DeviceAdapter, context: Context
+) -> CommandExecutionResult:
+    """Runs a command on a device and parses the output.
+
+    If the command has already been run on the device during this test case
+    execution, the cached result is returned instead.
+    """
+    cached_result = context.command_cache.get((device.name, command))
+    if cached_result is not None:
+        logger.info(
+            "Using cached result of command '%s' from device %s", command, device.name
+        )
+        return cached_result
+
+    output = device.execute(command)
+    return _process_command_output(command, output, device, context)
+
+
+def run_commands_on_device(
+    commands: list[str], device: DeviceAdapter, context: Context
+) -> dict[str, CommandExecutionResult]:
+    """Runs several commands on a device in a single call and parses the output.
+
+    Commands that have already been run on the device during this test case
+    execution are served from the cache and are not sent to the device again.
+    """
+    results = {}
+    pending_commands = []
+    for command in commands:
+        cached_result = context.command_cache.get((device.name, command))
+        if cached_result is not None:
+            results[command] = cached_result
+        else:
+            pending_commands.append(command)
+
+    if pending_commands:
+        outputs = device.execute_many(pending_commands)
+        for command in pending_commands:
+            results[command] = _process_command_output(
+                command, outputs[command], device, context
+            )
+
+    return results
+
+
+def _resolve_target_devices(
+    description: str,
+    testbed: TestbedAdapter | None = None,
+    device: DeviceAdapter | None = None,
+    devices: list[DeviceAdapter] | None = None,
+) -> list[DeviceAdapter]:
+    """Determines which devices a command should be executed against."""
+    if testbed is not None:
+        return list(testbed)
+    elif device is not None:
+        return [device]
+    elif devices is not None:
+        return list(devices)
+    raise ValueError(f"No target devices specified to execute {description} against")
 
 
 def run_command_on_devices(
@@ -114,41 +247,31 @@ def run_command_on_devices(
     devices: list[DeviceAdapter] | None = None,
 ) -> dict[str, CommandExecutionResult]:
     """Runs a command on one or more devices and parses the output."""
-    target_devices: Iterable[DeviceAdapter] = []
-    if testbed is not None:
-        target_devices = list(testbed)
-    elif device is not None:
-        target_devices = [device]
-    elif devices is not None:
-        target_devices = devices
-    else:
-        raise ValueError(
-            f"No target devices specified to execute command '{command}' against"
-        )
+    target_devices = _resolve_target_devices(
+        f"command '{command}'", testbed=testbed, device=device, devices=devices
+    )
 
     logger.info("Running command '%s' on devices: %d", command, len(target_devices))
 
     results = {}
     start_time = time.time()
 
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=len(target_devices)
-    ) as executor:
-        # Create a dictionary mapping futures to device names for result tracking
-        future_to_device = {
-            executor.submit(run_command_on_device, command, device, context): device
-            for device in target_devices
-        }
-
-        # Collect results as they complete
-        for future in concurrent.futures.as_completed(future_to_device):
-            device = future_to_device[future]
-            try:
-                result = future.result()
-                results[device.name] = result
-            except Exception as exc:
-                logger.error(f"Device {device.name} generated an exception: {exc}")
-                results[device.name] = None
+    executor = _get_executor()
+    # Create a dictionary mapping futures to device names for result tracking
+    future_to_device = {
+        executor.submit(run_command_on_device, command, device, context): device
+        for device in target_devices
+    }
+
+    # Collect results as they complete
+    for future in concurrent.futures.as_completed(future_to_device):
+        device = future_to_device[future]
+        try:
+            result = future.result()
+            results[device.name] = result
+        except Exception as exc:
+            logger.error("Device %s generated an exception: %s", device.name, exc)
+            results[device.name] = None
 
     total_time = time.time() - start_time
     logger.info(
@@ -160,6 +283,55 @@ def run_command_on_devices(
     return results
 
 
+def run_commands_on_devices(
+    commands: list[str],
+    context: Context,
+    testbed: TestbedAdapter | None = None,
+    device: DeviceAdapter | None = None,
+    devices: list[DeviceAdapter] | None = None,
+) -> dict[str, dict[str, CommandExecutionResult]]:
+    """Runs several commands on one or more devices and parses the output.
+
+    All commands are sent to each device in a single call. The results are
+    keyed by device name, then by command.
+    """
+    target_devices = _resolve_target_devices(
+        f"commands {commands}", testbed=testbed, device=device, devices=devices
+    )
+
+    logger.info(
+        "Running %d commands on devices: %d", len(commands), len(target_devices)
+    )
+
+    results = {}
+    start_time = time.time()
+
+    executor = _get_executor()
+    # Create a dictionary mapping futures to device names for result tracking
+    future_to_device = {
+        executor.submit(run_commands_on_device, commands, device, context): device
+        for device in target_devices
+    }
+
+    # Collect results as they complete
+    for future in concurrent.futures.as_completed(future_to_device):
+        device = future_to_device[future]
+        try:
+            results[device.name] = future.result()
+        except Exception as exc:
+            logger.error("Device %s generated an exception: %s", device.name, exc)
+            results[device.name] = None
+
+    total_time = time.time() - start_time
+    logger.info(
+        "Successfully executed %d commands on all devices in %.2f seconds",
+        len(commands),
+        total_time,
+    )
+
+    return results
+
+
 def disconnect_single_device(device: DeviceAdapter) -> None:
     """Helper function to disconnect from a single device."""
     logger.info(
@@ -187,16 +359,14 @@ def disconnect_from_testbed_devices(testbed: TestbedAdapter) -> None:
     logger.info("Disconnecting from all devices")
     device_list = list(testbed)
     start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=len(device_list)
-    ) as executor:
-        # Submit all device disconnection tasks to the executor
-        futures = [
-            executor.submit(disconnect_single_device, device) for device in device_list
-        ]
-
-        # Wait for all tasks to complete
-        concurrent.futures.wait(futures)
+    executor = _get_executor()
+    # Submit all device disconnection tasks to the executor
+    futures = [
+        executor.submit(disconnect_single_device, device) for device in device_list
+    ]
+
+    # Wait for all tasks to complete
+    concurrent.futures.wait(futures)
 
     total_time = time.time() - start_time
     logger.info("All device disconnections completed in %.2f seconds", total_time)
@@ -1,5 +1,6 @@
 """Contains constants used across pyATS test scripts."""
 
+import os
 from pathlib import Path
 
 # Save all parameters under the `parameters` directory at the root of the
@@ -20,3 +21,26 @@ TEMPLATE_NAMES = {
     "procedure": "PROCEDURE",
     "pass_fail_criteria": "PASS_FAIL_CRITERIA",
 }
+
+# Upper bound on how many devices are connected to, run commands against, or
+# disconnected from concurrently, so that large testbeds do not open one worker
+# thread per device
+MAX_COMMAND_WORKERS = 32
+
+# Number of worker threads used to read and copy per-test-case report files when
+# aggregating the final report
+MAX_REPORT_WORKERS = 16
+
+# Compiled Jinja2 templates are cached on disk, so that every job does not
+# recompile the report templates. By default Jinja2 keeps the cache in a private
+# per-user directory; this can point it elsewhere, e.g. a persistent location in CI.
+# The directory must be owned by the current user and not accessible to others.
+JINJA_CACHE_DIR = (
+    Path(os.environ["BRKXAR_JINJA_CACHE_DIR"])
+    if os.environ.get("BRKXAR_JINJA_CACHE_DIR")
+    else None
+)
+
+# Templates do not change during a run, so Jinja2 only checks template files for
+# changes when debugging
+JINJA_AUTO_RELOAD = bool(os.environ.get("BRKXAR_DEBUG"))
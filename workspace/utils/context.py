@@ -6,10 +6,15 @@ centralized point of access for the testbed adapter, corresponding device
 adapters, and test script results.
 """
 
+from typing import TYPE_CHECKING
+
 from utils.adapters import TestbedAdapter
 from utils.results import TestResultCollector
 from utils.types import RunningMode
 
+if TYPE_CHECKING:
+    from utils.connectivity import CommandExecutionResult
+
 
 class Context:
     """Execution context for pyATS test scripts.
@@ -39,3 +44,6 @@ class Context:
         self.testbed_adapter = testbed_adapter
         self.test_result_collector = test_result_collector
         self.parameters_file = parameters_file
+        # Parsed command results keyed by (device name, command), so that a
+        # command is only sent to a device once per test case execution.
+        self.command_cache: dict[tuple[str, str], "CommandExecutionResult"] = {}
@@ -14,16 +14,15 @@ logger = logging.getLogger(__name__)
 def validate_parameters_directory_exists(
     failed_callable: Callable[[str], None],
 ) -> None:
-    """Validate that the parameters directory exists."""
-    if PARAMETERS_DIR.exists() is False:
-        logger.info(f"Creating parameters directory: {PARAMETERS_DIR}")
-        try:
-            PARAMETERS_DIR.mkdir(parents=True, exist_ok=True)
-            logger.info("Parameters directory created successfully")
-        except Exception as e:
-            logger.error(f"Failed to create parameters directory: {e}")
-            failed_callable(f"Failed to create parameters directory: {e}")
-            raise
+    """Validate that the parameters directory exists, creating it if necessary."""
+    # mkdir with exist_ok already handles an existing directory, so there is no
+    # need to check for it first
+    try:
+        PARAMETERS_DIR.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error("Failed to create parameters directory: %s", e)
+        failed_callable(f"Failed to create parameters directory: {e}")
+        raise
 
 
 def save_parameters_to_file(data: ParameterData, parameters_file: str | Path) -> bool:
@@ -41,14 +40,16 @@ def save_parameters_to_file(data: ParameterData, parameters_file: str | Path) ->
 
     # Write parameters to JSON file
     try:
+        # Serialize in one go rather than with json.dump, which issues a separate
+        # write call for every token it encodes
+        serialized_data = json.dumps(data, indent=4)
         with open(str(parameters_file), "w") as f:
-            json.dump(data, f, indent=4)
             # Add newline to the end to make pre-commit hooks happy
-            f.write("\n")
+            f.write(serialized_data + "\n")
         logger.info("Successfully saved parameters to file '%s'", parameters_file)
         return True
     except Exception as e:
-        logger.error("Failed to write parameters to file '%s': %s", e)
+        logger.error("Failed to write parameters to file '%s': %s", parameters_file, e)
         raise
 
 
@@ -0,0 +1,90 @@
+"""Contains lightweight parsers for command output used by the test scripts.
+
+Genie parsers cover every variation of a command's output, which makes them
+comparatively slow on large tables. The parsers here only handle the fields the
+test scripts rely on, and produce the same structure as the equivalent Genie
+parser so that callers do not need to know which one was used.
+"""
+
+import re
+from typing import Any, Callable
+
+# Matches a single row of "show ip ospf neighbor" output, e.g.
+# 100.1.1.4         1   FULL/BDR        00:00:38    10.1.4.4        GigabitEthernet3
+# The state column may contain spaces on point-to-point links ("FULL/  -").
+# Only spaces and tabs separate columns, so a match never spans two lines.
+OSPF_NEIGHBOR_PATTERN = re.compile(
+    r"^(?P<neighbor>\d+\.\d+\.\d+\.\d+)[ \t]+(?P<priority>\d+)[ \t]+"
+    r"(?P<state>\S+(?:[ \t]+\S+)?)[ \t]+(?P<dead_time>\d+:\d+:\d+|-)[ \t]+"
+    r"(?P<address>\d+\.\d+\.\d+\.\d+)[ \t]+(?P<interface>\S+)[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+# Column header line of "show ip ospf neighbor" output
+OSPF_NEIGHBOR_HEADER = "Neighbor ID"
+
+# Genie expands abbreviated interface names (e.g. "Gi3.10" to
+# "GigabitEthernet3.10"). Only interface types already printed in full are
+# accepted here, so that the keys match the learned parameter files.
+FULL_INTERFACE_TYPES = frozenset(
+    {
+        "Ethernet",
+        "FastEthernet",
+        "GigabitEthernet",
+        "TenGigabitEthernet",
+        "TwentyFiveGigE",
+        "FortyGigabitEthernet",
+        "HundredGigE",
+        "Loopback",
+        "Port-channel",
+        "Serial",
+        "Tunnel",
+        "Vlan",
+    }
+)
+INTERFACE_TYPE_PATTERN = re.compile(r"[A-Za-z-]+")
+
+
+def parse_ospf_neighbor(output: str) -> dict[str, Any]:
+    """Parse the output of the "show ip ospf neighbor" command.
+
+    Args:
+        output: Raw output of the command
+
+    Returns:
+        Dictionary in the same shape as Genie's ShowIpOspfNeighbor parser, or an
+        empty dictionary if any data line or interface name is not recognized,
+        so that callers fall back to Genie rather than silently losing neighbors
+    """
+    data_lines = sum(
+        1
+        for line in output.splitlines()
+        if line.strip() and not line.lstrip().startswith(OSPF_NEIGHBOR_HEADER)
+    )
+    matches = list(OSPF_NEIGHBOR_PATTERN.finditer(output))
+    if len(matches) != data_lines:
+        return {}
+
+    interfaces: dict[str, Any] = {}
+    for match in matches:
+        neighbor, priority, state, dead_time, address, interface = match.groups()
+        interface_type = INTERFACE_TYPE_PATTERN.match(interface)
+        if interface_type is None or interface_type[0] not in FULL_INTERFACE_TYPES:
+            return {}
+        neighbors = interfaces.setdefault(interface, {"neighbors": {}})["neighbors"]
+        neighbors[neighbor] = {
+            "priority": int(priority),
+            "state": state,
+            "dead_time": dead_time,
+            "address": address,
+        }
+
+    if not interfaces:
+        return {}
+    return {"interfaces": interfaces}
+
+
+# Commands that can be parsed without Genie, mapped to their parser
+FAST_PARSERS: dict[str, Callable[[str], dict[str, Any]]] = {
+    "show ip ospf neighbor": parse_ospf_neighbor,
+}
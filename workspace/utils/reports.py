@@ -1,14 +1,21 @@
 """Contains utility functions used for generating customer-facing reports/deliverables."""
 
+import concurrent.futures
+import functools
 import json
+import os
+import shutil
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import markdown
+from jinja2 import Template
 from utils import templates
 from utils.constants import (
     AGGREGATED_REPORT_FILENAME,
+    MAX_REPORT_WORKERS,
     REPORT_ASSETS_DIR,
     REPORT_DIR,
     REPORT_RESULTS_DIR,
@@ -17,8 +24,12 @@ from utils.constants import (
 from utils.types import CommandExecution, Result, ResultStatus
 
 
+@functools.cache
 def ensure_results_dirs():
-    """Create the necessary directories for storing results if they don't exist."""
+    """Create the necessary directories for storing results if they don't exist.
+
+    The directories are only created once per process; later calls do nothing.
+    """
     for directory in [
         TEST_RESULTS_DIR,
         REPORT_DIR,
@@ -28,9 +39,13 @@ def ensure_results_dirs():
         directory.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=512)
 def convert_markdown_to_html(markdown_text: str) -> str:
     """Convert markdown text to HTML.
 
+    Conversions are cached, since the same sections are commonly rendered for
+    several reports.
+
     Args:
         markdown_text: Markdown-formatted text to convert
 
@@ -49,7 +64,7 @@ def generate_job_report(
     title: str,
     description: str,
     setup: str,
-    procedure: str,
+    procedure: str | Template,
     pass_fail_criteria: str,
     results: list[Result],
     command_executions: list[CommandExecution],
@@ -63,7 +78,8 @@ def generate_job_report(
         title: Test title
         description: Test description (from DESCRIPTION template)
         setup: Setup information (from SETUP template)
-        procedure: Test procedure (from PROCEDURE template)
+        procedure: Test procedure (from PROCEDURE template), either as a string
+            or as a template precompiled with templates.compile_string_template
         pass_fail_criteria: Pass/fail criteria (from PASS_FAIL_CRITERIA template)
         results: Detailed results of the test execution
         status: Status of the test execution
@@ -74,6 +90,8 @@ def generate_job_report(
     """
     ensure_results_dirs()
 
+    # Use a single timestamp for both the report and its metadata
+    now = datetime.now()
     passed = status == ResultStatus.PASSED
 
     # Render content with parameters as necessary
@@ -100,60 +118,97 @@ def generate_job_report(
     rendered_procedure_html = convert_markdown_to_html(rendered_procedure)
     rendered_criteria_html = convert_markdown_to_html(rendered_criteria)
 
-    # Format results for the template
-    formatted_results = []
-    for result in results:
-        formatted_results.append(
-            {
-                "message": result["message"],
-                "status": result["status"],  # Keep the original status
-            }
-        )
-
-    # Render the report using the template utility
-    html_content = templates.render_template(
+    # Stream the report straight to disk using the template utility. Results
+    # already carry only a message and status, so they are passed through as-is
+    # rather than copied.
+    output_file = TEST_RESULTS_DIR / f"{task_id}_results.html"
+    templates.render_template_to_file(
         "test_case/report.html.j2",
+        output_file,
         title=title,
         description_html=rendered_description_html,
         setup_html=rendered_setup_html,
         procedure_html=rendered_procedure_html,
         criteria_html=rendered_criteria_html,
-        results=formatted_results,
+        results=results,
         command_executions=command_executions,  # Add command executions to the template context
         status=status,  # Use the status directly
         passed=passed,  # Also include the boolean value for backward compatibility
-        generation_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        generation_time=now.strftime("%Y-%m-%d %H:%M:%S"),
     )
 
-    output_file = TEST_RESULTS_DIR / f"{task_id}_results.html"
-    output_file.write_text(html_content)
-
     # Save metadata for aggregation
     metadata = {
         "task_id": task_id,
         "title": title,
         "passed": passed,  # Keep this for backward compatibility
         "status": status,  # Include the full status value
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "result_file": str(output_file),
     }
     metadata_file = TEST_RESULTS_DIR / f"{task_id}_metadata.json"
-    metadata_file.write_text(json.dumps(metadata, indent=2))
+    # Metadata is only ever read back by aggregate_reports, so skip indentation
+    metadata_file.write_text(json.dumps(metadata, separators=(",", ":")))
 
     return output_file
 
 
-def aggregate_reports() -> Path:
-    """Aggregate all individual test results into a single HTML report."""
-    metadata_files = list(TEST_RESULTS_DIR.glob("*_metadata.json"))
-    all_results = []
+def start_job_report(**kwargs: Any) -> concurrent.futures.Future[Path]:
+    """Start generating an HTML report for a job execution in the background.
 
-    for metadata_file in metadata_files:
-        metadata = json.loads(metadata_file.read_text())
-        all_results.append(metadata)
+    This lets the report be rendered while the rest of cleanup (such as
+    disconnecting from devices) carries on.
+
+    Args:
+        **kwargs: Arguments to pass to generate_job_report
+
+    Returns:
+        Future resolving to the path of the generated HTML report file. Calling
+        result() waits for the report and re-raises any error from generating it.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="report"
+    )
+    future = executor.submit(generate_job_report, **kwargs)
+    # The submitted report still runs; this only lets the thread exit afterwards
+    executor.shutdown(wait=False)
+    return future
+
+
+def _load_metadata(metadata_file: str | Path) -> dict[str, Any]:
+    """Load the metadata saved alongside a test case's HTML report."""
+    with open(metadata_file, "rb") as f:
+        return json.load(f)
 
-    # Sort results by timestamp
-    all_results.sort(key=lambda x: x["timestamp"])
+
+def aggregate_reports() -> Path:
+    """Aggregate all individual test results into a single HTML report."""
+    # Scan the directory directly rather than through Path.glob, which builds a
+    # Path for every entry and matches each one against a compiled pattern
+    with os.scandir(TEST_RESULTS_DIR) as entries:
+        metadata_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith("_metadata.json") and entry.is_file()
+        ]
+
+    # Metadata files are read, and result files copied, concurrently since the
+    # work is dominated by filesystem latency
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_REPORT_WORKERS, thread_name_prefix="aggregate"
+    ) as executor:
+        all_results = list(executor.map(_load_metadata, metadata_files))
+
+        # Sort results by timestamp
+        all_results.sort(key=itemgetter("timestamp"))
+
+        # Copy result files from their current location to REPORT_RESULTS_DIR
+        result_files = [Path(result["result_file"]) for result in all_results]
+        result_file_dests = [
+            REPORT_RESULTS_DIR / result_file.name for result_file in result_files
+        ]
+        # Consuming the results re-raises any error from copying a file
+        list(executor.map(shutil.copyfile, result_files, result_file_dests))
 
     # Calculate summary statistics
     total_tests = len(all_results)
@@ -162,14 +217,13 @@ def aggregate_reports() -> Path:
     passed_tests = 0
     failed_tests = 0
 
+    # Result files all live directly in REPORT_RESULTS_DIR, so their path
+    # relative to REPORT_DIR only needs working out once
+    report_results_dir_path = str(REPORT_RESULTS_DIR.relative_to(REPORT_DIR))
+
     # Format results for the template
     formatted_results = []
-    for result in all_results:
-        # Copy result file from current location to REPORT_RESULTS_DIR
-        result_file = Path(result["result_file"])
-        result_file_dest = REPORT_RESULTS_DIR / result_file.name
-        result_file_dest.write_text(result_file.read_text())
-
+    for result, result_file_dest in zip(all_results, result_file_dests):
         # Get status from metadata
         # The status field should contain the actual test status (PASSED/FAILED/etc.)
         # not INFO which is just an individual result type
@@ -215,7 +269,9 @@ def aggregate_reports() -> Path:
                 "title": result["title"],
                 "status": status,
                 "timestamp": result["timestamp"],
-                "result_file_path": str(result_file_dest.relative_to(REPORT_DIR)),
+                "result_file_path": os.path.join(
+                    report_results_dir_path, result_file_dest.name
+                ),
             }
         )
 
@@ -223,9 +279,11 @@ def aggregate_reports() -> Path:
     total_pass_fail = passed_tests + failed_tests
     success_rate = (passed_tests / total_pass_fail * 100) if total_pass_fail > 0 else 0
 
-    # Render the report using the template utility
-    html_content = templates.render_template(
+    # Stream the report straight to disk using the template utility
+    output_file = REPORT_DIR / AGGREGATED_REPORT_FILENAME
+    templates.render_template_to_file(
         "summary/report.html.j2",
+        output_file,
         generation_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         total_tests=total_tests,
         passed_tests=passed_tests,
@@ -234,7 +292,4 @@ def aggregate_reports() -> Path:
         results=formatted_results,
     )
 
-    output_file = REPORT_DIR / AGGREGATED_REPORT_FILENAME
-    output_file.write_text(html_content)
-
     return output_file
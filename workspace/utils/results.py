@@ -1,8 +1,9 @@
 """Utilities for generating and managing customer-facing HTML test results."""
 
 import logging
+from typing import Iterable
 
-from .types import CommandExecution, ResultStatus
+from .types import CommandExecution, Result, ResultStatus
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +18,11 @@ class TestResultCollector:
 
     def __init__(self):
         """Initialize the result collector."""
-        self.results = []
+        self.results: list[Result] = []
         self.command_executions: list[CommandExecution] = []
+        # First non-PASSED, non-INFO status added, kept up to date as results
+        # are added so that the overall status does not require a scan
+        self._status = ResultStatus.PASSED
 
     @property
     def status(self) -> ResultStatus:
@@ -28,13 +32,16 @@ class TestResultCollector:
         If all results are INFO or PASSED, the status is PASSED.
         Otherwise, returns the first non-PASSED, non-INFO status found.
         """
-        for result in self.results:
-            if (
-                result["status"] != ResultStatus.PASSED
-                and result["status"] != ResultStatus.INFO
-            ):
-                return result["status"]
-        return ResultStatus.PASSED
+        return self._status
+
+    def _update_status(self, status: ResultStatus):
+        """Record status as the overall status if it is the first failing one."""
+        if (
+            self._status == ResultStatus.PASSED
+            and status != ResultStatus.PASSED
+            and status != ResultStatus.INFO
+        ):
+            self._status = status
 
     def add_result(self, status: ResultStatus, message: str):
         """Add a result to the collection.
@@ -43,13 +50,24 @@ class TestResultCollector:
             status: Result status from ResultStatus enum (e.g., ResultStatus.PASSED)
             message: Detailed result message
         """
-        logger.info("[RESULT][%s] %s", status, message)
-        self.results.append(
-            {
-                "status": status,
-                "message": message,
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[RESULT][%s] %s", status, message)
+        self.results.append(Result(status, message))
+        self._update_status(status)
+
+    def add_results(self, results: Iterable[tuple[ResultStatus, str]]):
+        """Add several results to the collection at once.
+
+        Args:
+            results: (status, message) pairs in the order they were produced
+        """
+        new_results = [Result(status, message) for status, message in results]
+        log_results = logger.isEnabledFor(logging.INFO)
+        for result in new_results:
+            if log_results:
+                logger.info("[RESULT][%s] %s", result.status, result.message)
+            self._update_status(result.status)
+        self.results.extend(new_results)
 
     def add_command_execution(
         self, device_name: str, command: str, output: str, data: dict | None = None
@@ -61,12 +79,13 @@ class TestResultCollector:
             command: The command that was executed
             output: The output of the command execution
         """
-        logger.debug("Recording command execution on %s: %s", device_name, command)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recording command execution on %s: %s", device_name, command)
         self.command_executions.append(
-            {
-                "device_name": device_name,
-                "command": command,
-                "output": output,
-                "data": data if data is not None else {},
-            }
+            CommandExecution(
+                device_name=device_name,
+                command=command,
+                output=output,
+                data=data if data is not None else {},
+            )
         )
@@ -21,10 +21,9 @@ def handle_test_execution_mode(
     failing_callable: Callable[[str], None],
 ) -> None:
     """Handles the flow control of test execution based upon provided mode."""
-    current_state = current_state_callable(context)
-
     # LEARNING MODE: Save the collected data to parameters file
     if context.mode == "learning":
+        current_state = current_state_callable(context)
         if save_parameters_to_file(current_state, context.parameters_file):
             result_msg = "Successfully learned parameters and saved to file"
             passing_callable(result_msg)
@@ -39,9 +38,13 @@ def handle_test_execution_mode(
             )
     # TESTING MODE: Verify against parameters file
     else:
-        # Load expected parameters
-        expected_parameters = load_parameters_from_file(context.parameters_file)
-        context.testbed_adapter.parameters = expected_parameters
+        # Common setup loads the expected parameters before prefetching any
+        # commands, and skips the prefetch if there are none. Only load them
+        # here if that has not happened.
+        expected_parameters = context.testbed_adapter.parameters
+        if not expected_parameters:
+            expected_parameters = load_parameters_from_file(context.parameters_file)
+            context.testbed_adapter.parameters = expected_parameters
         if not expected_parameters:
             result_msg = "No expected parameters found. Run in learning mode first."
             failing_callable(result_msg)
@@ -50,6 +53,10 @@ def handle_test_execution_mode(
             )
             return
 
+        # Gather current state only once the parameters are known to exist, so
+        # a missing parameters file does not run any commands on devices
+        current_state = current_state_callable(context)
+
         logger.info("Comparing current state to expected parameters")
         try:
             comparison_callable(current_state, expected_parameters, context)
@@ -1,11 +1,28 @@
 """Utility functions for working with Jinja2 templates."""
 
+import functools
+import logging
+import os
+import stat
 from datetime import datetime
 from pathlib import Path
-
-from jinja2 import BaseLoader, Environment, FileSystemLoader, StrictUndefined
+from types import MappingProxyType
+from typing import Mapping
+
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+)
+from utils.constants import JINJA_AUTO_RELOAD, JINJA_CACHE_DIR
 from utils.types import ResultStatus
 
+logger = logging.getLogger(__name__)
+
 # Get the absolute path to the templates directory
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
@@ -20,65 +37,117 @@ def format_datetime(dt_str: str | datetime) -> str:
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
-def get_status_style(status):
+# CSS class and display text for each result status. ResultStatus is a str
+# enum, so these also match the plain string values stored in report metadata.
+# The styles are read-only, so the same mapping is shared by every lookup.
+STATUS_STYLES = {
+    ResultStatus.PASSED: MappingProxyType(
+        {"css_class": "pass-status", "display_text": "PASSED"}
+    ),
+    ResultStatus.FAILED: MappingProxyType(
+        {"css_class": "fail-status", "display_text": "FAILED"}
+    ),
+    ResultStatus.SKIPPED: MappingProxyType(
+        {"css_class": "skip-status", "display_text": "SKIPPED"}
+    ),
+    ResultStatus.ABORTED: MappingProxyType(
+        {"css_class": "abort-status", "display_text": "ABORTED"}
+    ),
+    ResultStatus.ERRORED: MappingProxyType(
+        {"css_class": "error-status", "display_text": "ERROR"}
+    ),
+    ResultStatus.BLOCKED: MappingProxyType(
+        {"css_class": "block-status", "display_text": "BLOCKED"}
+    ),
+    ResultStatus.INFO: MappingProxyType(
+        {"css_class": "info-status", "display_text": "INFO"}
+    ),
+}
+
+
+def get_status_style(status) -> Mapping[str, str]:
     """Get the CSS class and display text for a result status.
 
     Args:
         status: A ResultStatus value or string representation
 
     Returns:
-        Dictionary with css_class and display_text keys
+        Mapping with css_class and display_text keys
     """
-    if isinstance(status, str):
-        # Try to convert string to enum
-        try:
-            status = ResultStatus(status)
-        except ValueError:
-            # If not a valid enum value, use a default
-            return {"css_class": "neutral-status", "display_text": status}
-
-    # Handle each possible ResultStatus value
-    if status == ResultStatus.PASSED:
-        return {"css_class": "pass-status", "display_text": "PASSED"}
-    elif status == ResultStatus.FAILED:
-        return {"css_class": "fail-status", "display_text": "FAILED"}
-    elif status == ResultStatus.SKIPPED:
-        return {"css_class": "skip-status", "display_text": "SKIPPED"}
-    elif status == ResultStatus.ABORTED:
-        return {"css_class": "abort-status", "display_text": "ABORTED"}
-    elif status == ResultStatus.ERRORED:
-        return {"css_class": "error-status", "display_text": "ERROR"}
-    elif status == ResultStatus.BLOCKED:
-        return {"css_class": "block-status", "display_text": "BLOCKED"}
-    elif status == ResultStatus.INFO:
-        return {"css_class": "info-status", "display_text": "INFO"}
-    else:
+    style = STATUS_STYLES.get(status)
+    if style is None:
         return {"css_class": "neutral-status", "display_text": str(status)}
+    return style
+
 
+# Custom filters registered on every Jinja2 environment
+JINJA_FILTERS = {
+    "format_datetime": format_datetime,
+    "status_style": get_status_style,
+}
 
+
+def get_bytecode_cache() -> BytecodeCache:
+    """Get the on-disk cache for compiled templates.
+
+    Jinja2's default cache directory is created per user with 0700 permissions
+    and has its ownership checked. A directory set through JINJA_CACHE_DIR is
+    held to the same standard, since Jinja2 executes whatever bytecode it finds
+    there; if it is not safe to use, the default is used instead.
+
+    Returns:
+        Bytecode cache to attach to a Jinja2 environment
+    """
+    if JINJA_CACHE_DIR is None:
+        return FileSystemBytecodeCache()
+
+    JINJA_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    cache_dir_stat = JINJA_CACHE_DIR.stat()
+    owned_by_user = cache_dir_stat.st_uid == os.getuid()
+    private = not stat.S_IMODE(cache_dir_stat.st_mode) & (stat.S_IRWXG | stat.S_IRWXO)
+    if not (owned_by_user and private):
+        logger.warning(
+            "Not using Jinja2 cache directory '%s' as it is not owned by the "
+            "current user or is accessible to other users; using the default "
+            "cache directory instead",
+            JINJA_CACHE_DIR,
+        )
+        return FileSystemBytecodeCache()
+    return FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+
+
+@functools.cache
 def get_jinja_environment(directory: str | Path | None = None) -> Environment:
     """Create a Jinja2 environment for rendering templates.
 
+    Environments are cached per directory, so templates loaded through them are
+    only compiled once per process. Templates loaded from a directory are also
+    cached on disk (see get_bytecode_cache), so they are not recompiled by every
+    job.
+
     Args:
         directory: Directory containing the templates (default: None)
 
     Returns:
         Jinja2 Environment configured for the specified directory
     """
+    bytecode_cache: BytecodeCache | None = None
     if directory is not None:
         loader = FileSystemLoader(str(directory))
+        bytecode_cache = get_bytecode_cache()
     else:
         loader = BaseLoader()
 
     environment = Environment(
         loader=loader,
+        bytecode_cache=bytecode_cache,
+        auto_reload=JINJA_AUTO_RELOAD,
         extensions=["jinja2.ext.do"],
         trim_blocks=True,
         lstrip_blocks=True,
         undefined=StrictUndefined,
     )
-    environment.filters["format_datetime"] = format_datetime
-    environment.filters["status_style"] = get_status_style
+    environment.filters.update(JINJA_FILTERS)
 
     return environment
 
@@ -98,16 +167,58 @@ def render_template(template_path: str, **context):
     return template.render(**context)
 
 
-def render_string_template(template_string: str, **context):
-    """Render a string template with the given context.
+def render_template_to_file(template_path: str, output_file: Path, **context):
+    """Render a template with the given context directly into a file.
+
+    The output is written in chunks as it is rendered, so the full document is
+    never held in memory as a single string.
+
+    Args:
+        template_path: Path to the template relative to the templates directory
+        output_file: File to write the rendered template to
+        **context: Variables to pass to the template
+    """
+    env = get_jinja_environment(TEMPLATES_DIR)
+    template = env.get_template(template_path)
+    template.stream(**context).dump(str(output_file), encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_string_template(template_string: str) -> Template:
+    """Compile a string template so it can be rendered repeatedly.
+
+    Compiled templates are cached by their source, so rendering the same string
+    template again skips compilation.
 
     Args:
         template_string: The Jinja2 template as a string
+
+    Returns:
+        Compiled Jinja2 template
+    """
+    env = get_jinja_environment()
+    return env.from_string(template_string)
+
+
+def render_string_template(template_string: str | Template, **context):
+    """Render a string template with the given context.
+
+    Args:
+        template_string: The Jinja2 template as a string, or a template
+            previously compiled with compile_string_template
         **context: Variables to pass to the template
 
     Returns:
         Rendered template as string
     """
-    env = get_jinja_environment()
-    template = env.from_string(template_string)
+    if isinstance(template_string, Template):
+        return template_string.render(**context)
+    # Plain text without any Jinja delimiters renders as itself
+    if (
+        "{{" not in template_string
+        and "{%" not in template_string
+        and "{#" not in template_string
+    ):
+        return template_string
+    template = compile_string_template(template_string)
     return template.render(**context)
@@ -1,7 +1,7 @@
 """Contains type definitions for pyATS test scripts."""
 
 from enum import Enum
-from typing import Any, TypedDict
+from typing import Any, NamedTuple
 
 
 class RunningMode(str, Enum):
@@ -24,14 +24,14 @@ class ResultStatus(str, Enum):
     INFO = "info"
 
 
-class Result(TypedDict):
+class Result(NamedTuple):
     """Represents a test result."""
 
     status: ResultStatus
     message: str
 
 
-class CommandExecution(TypedDict):
+class CommandExecution(NamedTuple):
     """Represents a command execution record."""
 
     device_name: str